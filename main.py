@@ -8,8 +8,8 @@ PhoneMCP - Android 设备控制 MCP Server
     phone-mcp --transport stdio         # 使用 stdio 传输
 """
 
-import argparse
 import sys
+from types import SimpleNamespace
 
 BANNER = """
 ╔══════════════════════════════════════════════════════════════╗
@@ -68,7 +68,70 @@ USAGE_GUIDE = """
 """
 
 
-def parse_args():
+# 选项名 -> (属性名, 类型)；None 表示不带参数的开关
+_OPTIONS = {
+    "-t": ("transport", str),
+    "--transport": ("transport", str),
+    "-H": ("host", str),
+    "--host": ("host", str),
+    "-p": ("port", int),
+    "--port": ("port", int),
+    "--path": ("path", str),
+    "--guide": ("guide", None),
+}
+_TRANSPORTS = ("sse", "stdio")
+
+
+def parse_args(argv=None):
+    """
+    解析命令行参数。
+
+    常见参数直接手动解析，避免每次启动都导入并构建 argparse（STDIO 模式下
+    MCP 客户端可能频繁重启进程）。遇到 --help 或非法参数时才回退到 argparse，
+    以获得完整的帮助与错误信息。
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args = SimpleNamespace(
+        transport="sse", host="0.0.0.0", port=8009, path="/Phone", guide=False
+    )
+
+    i = 0
+    while i < len(argv):
+        name, sep, value = argv[i].partition("=")
+        option = _OPTIONS.get(name)
+        if option is None:
+            return _build_parser().parse_args(argv)
+
+        attr, kind = option
+        if kind is None:
+            if sep:
+                return _build_parser().parse_args(argv)
+            setattr(args, attr, True)
+            i += 1
+            continue
+
+        if not sep:
+            if i + 1 >= len(argv):
+                return _build_parser().parse_args(argv)
+            value = argv[i + 1]
+            i += 1
+        try:
+            setattr(args, attr, kind(value))
+        except ValueError:
+            return _build_parser().parse_args(argv)
+        i += 1
+
+    if args.transport not in _TRANSPORTS:
+        return _build_parser().parse_args(argv)
+
+    return args
+
+
+def _build_parser():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="PhoneMCP - Android 设备控制 MCP Server",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -93,7 +156,7 @@ def parse_args():
     parser.add_argument(
         "-t", "--transport",
         default="sse",
-        choices=["sse", "stdio"],
+        choices=list(_TRANSPORTS),
         metavar="TYPE",
         help="传输模式: sse 或 stdio (默认: sse)"
     )
@@ -122,7 +185,7 @@ def parse_args():
         help="显示详细使用指南"
     )
 
-    return parser.parse_args()
+    return parser
 
 
 def main():
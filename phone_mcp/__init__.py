@@ -4,9 +4,16 @@ Phone MCP - Android automation via MCP protocol.
 A clean, independent MCP server for controlling Android devices through ADB.
 """
 
-from phone_mcp.server import mcp, run
-
 __version__ = "0.1.0"
 
 __all__ = ["mcp", "run", "__version__"]
 
+
+def __getattr__(name: str):
+    # Importing the server pulls in FastMCP and its web stack, so defer it
+    # until mcp/run are actually used (PEP 562).
+    if name in ("mcp", "run"):
+        from phone_mcp import server
+
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
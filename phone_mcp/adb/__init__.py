@@ -1,75 +1,85 @@
 """ADB utilities for Android device interaction."""
 
-from phone_mcp.adb.connection import (
-    ADBConnection,
-    ConnectionType,
-    DeviceInfo,
-    list_devices,
-    quick_connect,
-)
-from phone_mcp.adb.device import (
-    back,
-    double_tap,
-    get_current_app,
-    home,
-    launch_app,
-    long_press,
-    swipe,
-    tap,
-)
-from phone_mcp.adb.input import (
-    clear_text,
-    detect_and_set_adb_keyboard,
-    restore_keyboard,
-    type_text,
-)
-# OCR module uses lazy imports internally (paddleocr is optional).
-# Import only the non-paddleocr-dependent helpers at top level.
-from phone_mcp.adb.ocr import draw_annotated_screenshot
-from phone_mcp.adb.screenshot import Screenshot, get_screenshot
-from phone_mcp.adb.ui_hierarchy import (
-    UIElement,
-    find_element_by_index,
-    find_element_by_resource_id,
-    find_element_by_text,
-    format_elements_for_llm,
-    get_ui_elements,
-    get_ui_hierarchy_xml,
-)
+import importlib
 
-__all__ = [
+# Public name -> defining submodule. Submodules are imported on first
+# attribute access (PEP 562), so importing phone_mcp.adb stays cheap and
+# PIL / OCR dependencies are only loaded when actually needed.
+_EXPORTS = {
     # Connection
-    "ADBConnection",
-    "ConnectionType",
-    "DeviceInfo",
-    "list_devices",
-    "quick_connect",
+    "ADBConnection": "phone_mcp.adb.connection",
+    "ConnectionType": "phone_mcp.adb.connection",
+    "DeviceInfo": "phone_mcp.adb.connection",
+    "list_devices": "phone_mcp.adb.connection",
+    "quick_connect": "phone_mcp.adb.connection",
     # Device control
-    "tap",
-    "double_tap",
-    "long_press",
-    "swipe",
-    "back",
-    "home",
-    "launch_app",
-    "get_current_app",
+    "tap": "phone_mcp.adb.device",
+    "double_tap": "phone_mcp.adb.device",
+    "long_press": "phone_mcp.adb.device",
+    "swipe": "phone_mcp.adb.device",
+    "back": "phone_mcp.adb.device",
+    "home": "phone_mcp.adb.device",
+    "launch_app": "phone_mcp.adb.device",
+    "get_current_app": "phone_mcp.adb.device",
+    "get_current_app_async": "phone_mcp.adb.device",
+    "launch_app_async": "phone_mcp.adb.device",
+    "launch_app_by_package_async": "phone_mcp.adb.device",
+    "search_installed_apps_async": "phone_mcp.adb.device",
+    "tap_async": "phone_mcp.adb.device",
+    "double_tap_async": "phone_mcp.adb.device",
+    "long_press_async": "phone_mcp.adb.device",
+    "swipe_async": "phone_mcp.adb.device",
+    "back_async": "phone_mcp.adb.device",
+    "home_async": "phone_mcp.adb.device",
+    "press_key_async": "phone_mcp.adb.device",
+    "tap_commands": "phone_mcp.adb.device",
+    "double_tap_commands": "phone_mcp.adb.device",
+    "long_press_commands": "phone_mcp.adb.device",
+    "swipe_commands": "phone_mcp.adb.device",
+    "back_commands": "phone_mcp.adb.device",
+    "home_commands": "phone_mcp.adb.device",
+    "press_key_commands": "phone_mcp.adb.device",
+    "sleep_commands": "phone_mcp.adb.device",
+    "run_input_script_async": "phone_mcp.adb.device",
     # Input
-    "type_text",
-    "clear_text",
-    "detect_and_set_adb_keyboard",
-    "restore_keyboard",
+    "type_text": "phone_mcp.adb.input",
+    "clear_text": "phone_mcp.adb.input",
+    "detect_and_set_adb_keyboard": "phone_mcp.adb.input",
+    "restore_keyboard": "phone_mcp.adb.input",
     # Screenshot
-    "Screenshot",
-    "get_screenshot",
+    "Screenshot": "phone_mcp.adb.screenshot",
+    "get_screenshot": "phone_mcp.adb.screenshot",
+    "get_screenshot_async": "phone_mcp.adb.screenshot",
+    "get_screenshot_bytes": "phone_mcp.adb.screenshot",
+    "get_screenshot_bytes_async": "phone_mcp.adb.screenshot",
+    "get_screenshot_jpeg_async": "phone_mcp.adb.screenshot",
     # UI Hierarchy
-    "UIElement",
-    "get_ui_elements",
-    "get_ui_hierarchy_xml",
-    "find_element_by_text",
-    "find_element_by_resource_id",
-    "find_element_by_index",
-    "format_elements_for_llm",
-    # OCR (draw_annotated_screenshot; ocr_get_ui_elements is lazy-imported in ui_hierarchy)
-    "draw_annotated_screenshot",
-]
+    "UIElement": "phone_mcp.adb.ui_hierarchy",
+    "ElementIndex": "phone_mcp.adb.ui_hierarchy",
+    "get_ui_elements": "phone_mcp.adb.ui_hierarchy",
+    "get_ui_elements_async": "phone_mcp.adb.ui_hierarchy",
+    "get_ui_hierarchy_xml": "phone_mcp.adb.ui_hierarchy",
+    "find_element_by_text": "phone_mcp.adb.ui_hierarchy",
+    "find_element_by_any_text": "phone_mcp.adb.ui_hierarchy",
+    "find_element_by_resource_id": "phone_mcp.adb.ui_hierarchy",
+    "find_element_by_index": "phone_mcp.adb.ui_hierarchy",
+    "format_elements_for_llm": "phone_mcp.adb.ui_hierarchy",
+    # OCR (paddleocr itself is imported lazily inside the OCR module;
+    # ocr_get_ui_elements is lazy-imported in ui_hierarchy)
+    "draw_annotated_screenshot": "phone_mcp.adb.ocr",
+}
 
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
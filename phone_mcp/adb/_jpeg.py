@@ -0,0 +1,76 @@
+"""JPEG encoding and decoding with an optional libjpeg-turbo fast path.
+
+If PyTurboJPEG and the libturbojpeg shared library are installed
+(pip install phone-mcp[speedups]), frames are encoded and decoded through
+the TurboJPEG C API directly. Otherwise Pillow is used with the same settings.
+"""
+
+import io
+
+from PIL import Image
+
+# None: not probed yet, False: unavailable, otherwise a TurboJPEG instance.
+_turbo = None
+
+
+def _get_turbo():
+    global _turbo
+    if _turbo is None:
+        try:
+            from turbojpeg import TurboJPEG
+            _turbo = TurboJPEG()
+        except Exception:
+            # ImportError, or RuntimeError/OSError when libturbojpeg is missing.
+            _turbo = False
+    return _turbo or None
+
+
+def encode_jpeg(image, quality: int) -> bytes:
+    """
+    Encode an RGB image as a baseline 4:2:0 JPEG.
+
+    Args:
+        image: A PIL image in RGB mode, or a C-contiguous uint8 numpy array
+            of shape (height, width, 3).
+        quality: JPEG quality (1-100).
+
+    Returns:
+        The encoded JPEG bytes.
+    """
+    turbo = _get_turbo()
+    if turbo is not None:
+        import numpy as np
+        from turbojpeg import TJPF_RGB, TJSAMP_420
+
+        return turbo.encode(
+            np.ascontiguousarray(image),
+            quality=quality,
+            pixel_format=TJPF_RGB,
+            jpeg_subsample=TJSAMP_420,
+        )
+
+    if not isinstance(image, Image.Image):
+        image = Image.fromarray(image)
+    output = io.BytesIO()
+    image.save(
+        output, format="JPEG", quality=quality, optimize=False, progressive=False, subsampling=2
+    )
+    return output.getvalue()
+
+
+def decode_jpeg(data: bytes):
+    """
+    Decode JPEG bytes to an RGB uint8 numpy array of shape (height, width, 3).
+    """
+    import numpy as np
+
+    turbo = _get_turbo()
+    if turbo is not None:
+        from turbojpeg import TJPF_RGB
+
+        return turbo.decode(data, pixel_format=TJPF_RGB)
+
+    img = Image.open(io.BytesIO(data))
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return np.asarray(img)
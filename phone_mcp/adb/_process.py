@@ -0,0 +1,142 @@
+"""One-shot adb invocations.
+
+Short device commands go through the persistent shells in _shell_pool. This
+module covers the remaining one-shot calls (``exec-out``, ``pull``, ...):
+run_adb() awaits the adb child on the event loop instead of parking a worker
+thread in ``subprocess.run``, and read_adb_output() is a blocking reader
+tuned for multi-megabyte screen captures.
+"""
+
+import asyncio
+import subprocess
+import sys
+import threading
+
+
+async def run_adb(
+    args: list[str],
+    device_id: str | None = None,
+    timeout: float | None = None,
+    merge_stderr: bool = False,
+) -> tuple[int, bytes]:
+    """
+    Run ``adb [-s device_id] <args>`` and collect its stdout.
+
+    Args:
+        args: Arguments after the adb executable, e.g. ["exec-out", "screencap"].
+        device_id: Optional ADB device ID.
+        timeout: Seconds to wait before killing adb.
+        merge_stderr: Also collect stderr into the returned output.
+
+    Returns:
+        Tuple of (exit code, stdout bytes).
+
+    Raises:
+        subprocess.TimeoutExpired: If adb did not finish in time.
+    """
+    cmd = ["adb", "-s", device_id, *args] if device_id else ["adb", *args]
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT if merge_stderr else subprocess.DEVNULL,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        await _kill(proc)
+        raise subprocess.TimeoutExpired(cmd, timeout) from None
+    except asyncio.CancelledError:
+        # Do not leave adb running behind a cancelled caller.
+        await _kill(proc)
+        raise
+    return proc.returncode, stdout
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    if proc.returncode is None:
+        proc.kill()
+        await proc.wait()
+
+
+# Linux lets a pipe hold up to /proc/sys/fs/pipe-max-size (1 MiB by default)
+# instead of 64 KiB, so the reader wakes up far less often per capture.
+_F_SETPIPE_SZ = 1031
+_PIPE_SIZE = 1 << 20
+_INITIAL_BUFFER = 2 << 20
+
+
+def read_adb_output(
+    args: list[str], device_id: str | None = None, timeout: float | None = None
+) -> tuple[int, bytearray]:
+    """
+    Run ``adb [-s device_id] <args>`` and read all of its stdout.
+
+    Unlike ``subprocess.run(capture_output=True)``, which reads in 32 KiB
+    chunks and joins them, this enlarges the pipe on Linux and reads
+    straight into one preallocated, doubling buffer.
+
+    Returns:
+        Tuple of (exit code, stdout). The bytearray is handed over to the
+        caller without another copy.
+
+    Raises:
+        subprocess.TimeoutExpired: If adb did not finish in time.
+    """
+    cmd = ["adb", "-s", device_id, *args] if device_id else ["adb", *args]
+    proc = subprocess.Popen(
+        cmd,
+        bufsize=0,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    if sys.platform == "linux":
+        import fcntl
+        try:
+            fcntl.fcntl(proc.stdout.fileno(), _F_SETPIPE_SZ, _PIPE_SIZE)
+        except OSError:
+            pass
+
+    timed_out = threading.Event()
+
+    def _kill():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill) if timeout is not None else None
+    if timer:
+        timer.daemon = True
+        timer.start()
+
+    buffer = bytearray(_INITIAL_BUFFER)
+    size = 0
+    try:
+        while True:
+            if size == len(buffer):
+                buffer.extend(bytes(len(buffer)))
+            with memoryview(buffer) as view:
+                read = proc.stdout.readinto(view[size:])
+            if not read:
+                break
+            size += read
+        # Stop the timer once the output is complete, so it cannot fire
+        # while we reap an adb that already finished.
+        if timer:
+            timer.cancel()
+        returncode = proc.wait()
+    finally:
+        if timer:
+            timer.cancel()
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+    # The timer may still have fired just before being cancelled; only a
+    # process it actually killed counts as timed out.
+    if timed_out.is_set() and returncode < 0:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    del buffer[size:]
+    return returncode, buffer
@@ -0,0 +1,288 @@
+"""Persistent ``adb shell`` sessions shared by the device control helpers.
+
+Spawning a fresh ``adb`` client for every command pays process startup plus
+the ADB handshake each time. A PersistentAdbShell keeps one ``adb shell``
+process open per device and feeds it newline-delimited commands instead,
+reading until an echoed sentinel to find where each command's output ends.
+
+With PHONE_MCP_ADB_BACKEND=adb-shell, network devices ("host:port") are
+instead driven by TcpAdbShell, which speaks the ADB wire protocol to adbd
+over one socket via the optional adb-shell package, bypassing the adb
+client and server altogether.
+"""
+
+import atexit
+import os
+import queue
+import re
+import subprocess
+import threading
+
+_SENTINEL = "__PHONE_MCP_END__"
+_SENTINEL_RE = re.compile(rb"__PHONE_MCP_END__(\d+)\r?\n")
+_READ_CHUNK = 65536
+
+
+class PersistentAdbShell:
+    """
+    A long-lived ``adb shell`` process bound to a single device.
+
+    Commands are serialized with a lock, so one instance can be shared by
+    every thread talking to the same device. If the shell dies (device
+    unplugged, adb server restarted) it is transparently respawned on the
+    next call.
+    """
+
+    def __init__(self, device_id: str | None = None, adb_path: str = "adb"):
+        """Initialize the shell; the adb process is started lazily."""
+        self.device_id = device_id
+        self.adb_path = adb_path
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+        self._chunks: queue.Queue = queue.Queue()
+        self._buffer = bytearray()
+
+    def run(self, cmd: str, timeout: float | None = None) -> tuple[int, str]:
+        """
+        Run a shell command on the device.
+
+        Args:
+            cmd: Command line to execute in the device shell.
+            timeout: Seconds to wait for the command to finish.
+
+        Returns:
+            Tuple of (exit code, stdout decoded as UTF-8).
+
+        Raises:
+            subprocess.TimeoutExpired: If the command did not finish in time.
+                The shell is killed and restarted on the next call.
+        """
+        returncode, output = self._communicate(cmd, timeout)
+        return returncode, output.decode("utf-8", errors="replace")
+
+    def run_bytes(self, cmd: str, timeout: float | None = None) -> tuple[int, bytes]:
+        """Like run(), but return stdout as raw bytes without decoding."""
+        return self._communicate(cmd, timeout)
+
+    def close(self) -> None:
+        """Terminate the underlying adb process."""
+        with self._lock:
+            self._terminate()
+
+    def _communicate(self, cmd: str, timeout: float | None) -> tuple[int, bytes]:
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+
+            # Group the command so the sentinel reports its exit status, and
+            # detach its stdin so it cannot swallow the commands that follow.
+            script = f"{{ {cmd}\n}} </dev/null; echo {_SENTINEL}$?\n"
+            try:
+                self._proc.stdin.write(script.encode("utf-8"))
+                self._proc.stdin.flush()
+            except OSError:
+                # The shell already exited; collect whatever it printed below.
+                pass
+
+            try:
+                return self._read_until_sentinel(cmd, timeout)
+            except BaseException:
+                self._terminate()
+                raise
+
+    def _start(self) -> None:
+        args = [self.adb_path]
+        if self.device_id:
+            args.extend(["-s", self.device_id])
+        args.append("shell")
+
+        self._proc = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            # adb reports "device not found" / "unauthorized" on stderr.
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+        )
+        self._chunks = queue.Queue()
+        self._buffer = bytearray()
+        threading.Thread(
+            target=_pump, args=(self._proc.stdout, self._chunks), daemon=True
+        ).start()
+
+    def _read_until_sentinel(self, cmd: str, timeout: float | None) -> tuple[int, bytes]:
+        buffer = self._buffer
+        search_from = 0
+        while True:
+            match = _SENTINEL_RE.search(buffer, search_from)
+            if match:
+                returncode = int(match.group(1))
+                output = bytes(buffer[: match.start()])
+                del buffer[: match.end()]
+                return returncode, output
+
+            # Only rescan the tail that could hold a sentinel split across chunks.
+            search_from = max(0, len(buffer) - len(_SENTINEL) - 8)
+            try:
+                chunk = self._chunks.get(timeout=timeout)
+            except queue.Empty:
+                raise subprocess.TimeoutExpired(cmd, timeout) from None
+
+            if chunk is None:
+                # The shell exited before answering, e.g. no device attached.
+                returncode = self._proc.wait()
+                output = bytes(buffer)
+                self._terminate()
+                return returncode or 1, output
+
+            buffer.extend(chunk)
+
+    def _terminate(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+def _pump(stream, chunks: queue.Queue) -> None:
+    """Forward raw stdout chunks to a queue so reads can time out portably."""
+    try:
+        while True:
+            data = stream.read(_READ_CHUNK)
+            if not data:
+                break
+            chunks.put(data)
+    except (OSError, ValueError):
+        pass
+    finally:
+        chunks.put(None)
+
+
+class TcpAdbShell:
+    """
+    Device shell over a direct ADB protocol connection to adbd (TCP only).
+
+    Same interface and exit-status semantics as PersistentAdbShell. The
+    RSA key of the local adb installation (~/.android/adbkey, or the path
+    in PHONE_MCP_ADB_KEY) is used to authenticate; the device must already
+    have accepted it once.
+    """
+
+    def __init__(self, device_id: str):
+        """Initialize the shell; the connection is opened lazily."""
+        host, _, port = device_id.rpartition(":")
+        self.device_id = device_id
+        self.host = host
+        self.port = int(port)
+        self._lock = threading.Lock()
+        self._device = None
+
+    def run(self, cmd: str, timeout: float | None = None) -> tuple[int, str]:
+        """Run a shell command on the device; see PersistentAdbShell.run()."""
+        returncode, output = self._communicate(cmd, timeout)
+        return returncode, output.decode("utf-8", errors="replace")
+
+    def run_bytes(self, cmd: str, timeout: float | None = None) -> tuple[int, bytes]:
+        """Like run(), but return stdout as raw bytes without decoding."""
+        return self._communicate(cmd, timeout)
+
+    def close(self) -> None:
+        """Close the connection to adbd."""
+        with self._lock:
+            self._disconnect()
+
+    def _communicate(self, cmd: str, timeout: float | None) -> tuple[int, bytes]:
+        from adb_shell.exceptions import AdbTimeoutError, TcpTimeoutException
+
+        with self._lock:
+            if self._device is None:
+                self._connect()
+
+            script = f"{{ {cmd}\n}} </dev/null; echo {_SENTINEL}$?"
+            try:
+                output = self._device.shell(
+                    script,
+                    # Long on-device sleeps send no packets, so the read
+                    # timeout has to cover the whole command.
+                    read_timeout_s=timeout if timeout is not None else _NO_READ_TIMEOUT,
+                    timeout_s=timeout,
+                    decode=False,
+                )
+            except (AdbTimeoutError, TcpTimeoutException):
+                self._disconnect()
+                raise subprocess.TimeoutExpired(cmd, timeout) from None
+            except BaseException:
+                self._disconnect()
+                raise
+
+        match = None
+        for match in _SENTINEL_RE.finditer(output):
+            pass
+        if match is None:
+            return 1, output
+        return int(match.group(1)), output[: match.start()]
+
+    def _connect(self) -> None:
+        from adb_shell.adb_device import AdbDeviceTcp
+        from adb_shell.auth.sign_pythonrsa import PythonRSASigner
+
+        key_path = os.environ.get("PHONE_MCP_ADB_KEY") or os.path.expanduser(
+            "~/.android/adbkey"
+        )
+        device = AdbDeviceTcp(self.host, self.port, default_transport_timeout_s=9.0)
+        device.connect(rsa_keys=[PythonRSASigner.FromRSAKeyPath(key_path)], auth_timeout_s=5.0)
+        self._device = device
+
+    def _disconnect(self) -> None:
+        device, self._device = self._device, None
+        if device is not None:
+            try:
+                device.close()
+            except Exception:
+                pass
+
+
+_NO_READ_TIMEOUT = 24 * 3600.0
+
+
+_shells: dict[str | None, PersistentAdbShell | TcpAdbShell] = {}
+_shells_lock = threading.Lock()
+
+
+def get_shell(device_id: str | None = None) -> PersistentAdbShell | TcpAdbShell:
+    """Get the shared persistent shell for a device, creating it on first use."""
+    with _shells_lock:
+        shell = _shells.get(device_id)
+        if shell is None:
+            shell = _shells[device_id] = _create_shell(device_id)
+        return shell
+
+
+def _create_shell(device_id: str | None) -> PersistentAdbShell | TcpAdbShell:
+    if (
+        device_id
+        and ":" in device_id
+        and os.environ.get("PHONE_MCP_ADB_BACKEND", "").lower() == "adb-shell"
+    ):
+        return TcpAdbShell(device_id)
+    return PersistentAdbShell(device_id)
+
+
+def close_all() -> None:
+    """Close every persistent shell opened by this process."""
+    with _shells_lock:
+        shells = list(_shells.values())
+        _shells.clear()
+    for shell in shells:
+        shell.close()
+
+
+atexit.register(close_all)
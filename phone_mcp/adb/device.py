@@ -1,11 +1,21 @@
 """Device control utilities for Android automation."""
 
-import subprocess
+import asyncio
+import json
+import os
+import re
+import shlex
+import tempfile
+import threading
 import time
 
-from phone_mcp.config.apps import APP_PACKAGES
+from phone_mcp.adb._shell_pool import get_shell
+from phone_mcp.config.apps import APP_PACKAGES, PACKAGE_TO_APP
 from phone_mcp.config.timing import TIMING_CONFIG
 
+# Package of the focused window, e.g. "mCurrentFocus=Window{... u0 com.tencent.mm/...}".
+_FOCUS_RE = re.compile(rb"(?:mCurrentFocus|mFocusedApp)=[^\n]*?([\w.]+)/")
+
 
 def get_current_app(device_id: str | None = None) -> str:
     """
@@ -17,23 +27,14 @@ def get_current_app(device_id: str | None = None) -> str:
     Returns:
         The app name if recognized, otherwise "System Home".
     """
-    adb_prefix = _get_adb_prefix(device_id)
-
-    result = subprocess.run(
-        adb_prefix + ["shell", "dumpsys", "window"],
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-    )
-    output = result.stdout
+    _, output = get_shell(device_id).run_bytes("dumpsys window")
     if not output:
         raise ValueError("No output from dumpsys window")
 
-    for line in output.split("\n"):
-        if "mCurrentFocus" in line or "mFocusedApp" in line:
-            for app_name, package in APP_PACKAGES.items():
-                if package in line:
-                    return app_name
+    for match in _FOCUS_RE.finditer(output):
+        app_name = PACKAGE_TO_APP.get(match.group(1).decode("ascii"))
+        if app_name:
+            return app_name
 
     return "System Home"
 
@@ -45,11 +46,7 @@ def tap(
     if delay is None:
         delay = TIMING_CONFIG.device.default_tap_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
-
-    subprocess.run(
-        adb_prefix + ["shell", "input", "tap", str(x), str(y)], capture_output=True
-    )
+    get_shell(device_id).run(_tap_cmd(x, y))
     time.sleep(delay)
 
 
@@ -60,15 +57,11 @@ def double_tap(
     if delay is None:
         delay = TIMING_CONFIG.device.default_double_tap_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
+    shell = get_shell(device_id)
 
-    subprocess.run(
-        adb_prefix + ["shell", "input", "tap", str(x), str(y)], capture_output=True
-    )
+    shell.run(_tap_cmd(x, y))
     time.sleep(TIMING_CONFIG.device.double_tap_interval)
-    subprocess.run(
-        adb_prefix + ["shell", "input", "tap", str(x), str(y)], capture_output=True
-    )
+    shell.run(_tap_cmd(x, y))
     time.sleep(delay)
 
 
@@ -83,13 +76,7 @@ def long_press(
     if delay is None:
         delay = TIMING_CONFIG.device.default_long_press_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
-
-    subprocess.run(
-        adb_prefix
-        + ["shell", "input", "swipe", str(x), str(y), str(x), str(y), str(duration_ms)],
-        capture_output=True,
-    )
+    get_shell(device_id).run(_swipe_cmd(x, y, x, y, duration_ms))
     time.sleep(delay)
 
 
@@ -106,27 +93,7 @@ def swipe(
     if delay is None:
         delay = TIMING_CONFIG.device.default_swipe_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
-
-    if duration_ms is None:
-        dist_sq = (start_x - end_x) ** 2 + (start_y - end_y) ** 2
-        duration_ms = int(dist_sq / 1000)
-        duration_ms = max(1000, min(duration_ms, 2000))
-
-    subprocess.run(
-        adb_prefix
-        + [
-            "shell",
-            "input",
-            "swipe",
-            str(start_x),
-            str(start_y),
-            str(end_x),
-            str(end_y),
-            str(duration_ms),
-        ],
-        capture_output=True,
-    )
+    get_shell(device_id).run(_swipe_cmd(start_x, start_y, end_x, end_y, duration_ms))
     time.sleep(delay)
 
 
@@ -135,11 +102,7 @@ def back(device_id: str | None = None, delay: float | None = None) -> None:
     if delay is None:
         delay = TIMING_CONFIG.device.default_back_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
-
-    subprocess.run(
-        adb_prefix + ["shell", "input", "keyevent", "4"], capture_output=True
-    )
+    get_shell(device_id).run("input keyevent 4")
     time.sleep(delay)
 
 
@@ -148,22 +111,22 @@ def home(device_id: str | None = None, delay: float | None = None) -> None:
     if delay is None:
         delay = TIMING_CONFIG.device.default_home_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
-
-    subprocess.run(
-        adb_prefix + ["shell", "input", "keyevent", "KEYCODE_HOME"], capture_output=True
-    )
+    get_shell(device_id).run("input keyevent KEYCODE_HOME")
     time.sleep(delay)
 
 
 def launch_app(
-    app_name: str, device_id: str | None = None, delay: float | None = None
+    app_name: str,
+    device_id: str | None = None,
+    delay: float | None = None,
+    refresh: bool = False,
 ) -> bool:
     """
     Launch an app by name.
 
     Uses am start with the launcher activity to reliably start apps.
-    Falls back to monkey command if am start fails.
+    Falls back to monkey command if am start fails. The resolved launcher
+    activity is cached per device; pass refresh=True to resolve it again.
     """
     if delay is None:
         delay = TIMING_CONFIG.device.default_launch_delay
@@ -171,85 +134,17 @@ def launch_app(
     if app_name not in APP_PACKAGES:
         return False
 
-    adb_prefix = _get_adb_prefix(device_id)
     package = APP_PACKAGES[app_name]
-
-    # 方法1：使用 am start 启动应用的启动器活动（更可靠）
-    # 先获取应用的 launcher activity
-    result = subprocess.run(
-        adb_prefix + [
-            "shell",
-            "cmd", "package", "resolve-activity",
-            "--brief",
-            "-c", "android.intent.category.LAUNCHER",
-            package,
-        ],
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-    )
-
-    activity = None
-    if result.returncode == 0 and result.stdout.strip():
-        # 解析输出，格式通常是 "priority=0 preferredOrder=0 match=0x108000 specificIndex=-1 isDefault=true\ncom.package.name/.ActivityName"
-        lines = result.stdout.strip().split('\n')
-        for line in lines:
-            if '/' in line and not line.startswith('priority'):
-                activity = line.strip()
-                break
-
-    if activity:
-        # 使用 am start 启动具体的 activity
-        result = subprocess.run(
-            adb_prefix + [
-                "shell",
-                "am", "start",
-                "-n", activity,
-            ],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-        )
-        if result.returncode == 0 and "Error" not in result.stdout:
-            time.sleep(delay)
-            return True
-
-    # 方法2：使用 am start 通过 intent 启动（备选方案）
-    result = subprocess.run(
-        adb_prefix + [
-            "shell",
-            "am", "start",
-            "-a", "android.intent.action.MAIN",
-            "-c", "android.intent.category.LAUNCHER",
-            "-n", f"{package}/.MainActivity",
-        ],
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-    )
-
-    # 检查是否成功
-    if result.returncode == 0 and "Error" not in result.stdout:
-        time.sleep(delay)
-        return True
-
-    # 方法3：使用 monkey 命令作为最后的备选方案
-    subprocess.run(
-        adb_prefix + [
-            "shell",
-            "monkey",
-            "-p", package,
-            "-c", "android.intent.category.LAUNCHER",
-            "1",
-        ],
-        capture_output=True,
-    )
+    _launch_package(package, device_id, try_main_activity=True, refresh=refresh)
     time.sleep(delay)
     return True
 
 
 def launch_app_by_package(
-    package: str, device_id: str | None = None, delay: float | None = None
+    package: str,
+    device_id: str | None = None,
+    delay: float | None = None,
+    refresh: bool = False,
 ) -> bool:
     """
     Launch an app by package name.
@@ -258,6 +153,7 @@ def launch_app_by_package(
         package: The package name (e.g., "com.tencent.mm")
         device_id: Optional ADB device ID
         delay: Delay after launching
+        refresh: Ignore the cached launcher activity and resolve it again
 
     Returns:
         True if launch succeeded, False otherwise
@@ -265,56 +161,155 @@ def launch_app_by_package(
     if delay is None:
         delay = TIMING_CONFIG.device.default_launch_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
-
-    # 方法1：获取并启动 launcher activity
-    result = subprocess.run(
-        adb_prefix + [
-            "shell",
-            "cmd", "package", "resolve-activity",
-            "--brief",
-            "-c", "android.intent.category.LAUNCHER",
-            package,
-        ],
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-    )
+    output = _launch_package(package, device_id, try_main_activity=False, refresh=refresh)
 
-    activity = None
-    if result.returncode == 0 and result.stdout.strip():
-        lines = result.stdout.strip().split('\n')
-        for line in lines:
-            if '/' in line and not line.startswith('priority'):
-                activity = line.strip()
-                break
-
-    if activity:
-        result = subprocess.run(
-            adb_prefix + ["shell", "am", "start", "-n", activity],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-        )
-        if result.returncode == 0 and "Error" not in result.stdout:
-            time.sleep(delay)
-            return True
-
-    # 方法2：使用 monkey 命令
-    result = subprocess.run(
-        adb_prefix + [
-            "shell", "monkey",
-            "-p", package,
-            "-c", "android.intent.category.LAUNCHER",
-            "1",
-        ],
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
+    time.sleep(delay)
+    # Only the monkey fallback prints anything; am start output is captured on-device.
+    return "No activities found" not in output
+
+
+_LAUNCHER_CATEGORY = "android.intent.category.LAUNCHER"
+_ACTIVITY_MARKER = "__PHONE_MCP_ACTIVITY__"
+
+
+def _launch_package(
+    package: str, device_id: str | None, try_main_activity: bool, refresh: bool
+) -> str:
+    """Run the launch script and keep the activity cache in sync with its result."""
+    cached_activity = None if refresh else _get_cached_activity(device_id, package)
+    _, output = get_shell(device_id).run(
+        _build_launch_script(package, try_main_activity, cached_activity)
     )
 
-    time.sleep(delay)
-    return "No activities found" not in result.stdout
+    # The script reports the activity it resolved, which only happens when
+    # there was no cached activity or the cached one failed to start.
+    lines = []
+    for line in output.split("\n"):
+        if line.startswith(_ACTIVITY_MARKER):
+            _set_cached_activity(device_id, package, line[len(_ACTIVITY_MARKER):].strip())
+        else:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def _build_launch_script(
+    package: str, try_main_activity: bool, cached_activity: str | None = None
+) -> str:
+    """
+    Build a single on-device script that launches a package.
+
+    Resolving the launcher activity, starting it and the fallbacks all run in
+    one round-trip instead of one adb call per step:
+
+    0. 如果有缓存的 launcher activity，直接启动
+    1. 获取 launcher activity 并用 am start 启动（最可靠）
+    2. 可选：通过 MAIN intent 启动 .MainActivity
+    3. 使用 monkey 命令作为最后的备选方案
+
+    The script runs in a subshell so ``exit`` stops it without closing the
+    persistent shell. An ``am start`` attempt counts as successful when it
+    exits 0 and its output contains no "Error".
+    """
+    pkg = shlex.quote(package)
+    started = 'case "$o" in *Error*) false;; esac && exit 0'
+
+    lines = ["("]
+    if cached_activity:
+        lines.append(f"o=$(am start -n {shlex.quote(cached_activity)}) && {started}")
+    lines.extend([
+        f"a=$(cmd package resolve-activity --brief -c {_LAUNCHER_CATEGORY} {pkg}"
+        " | grep -v '^priority' | grep / | head -n 1)",
+        f'echo "{_ACTIVITY_MARKER}$a"',
+        f'[ -n "$a" ] && o=$(am start -n "$a") && {started}',
+    ])
+    if try_main_activity:
+        lines.append(
+            "o=$(am start -a android.intent.action.MAIN "
+            f"-c {_LAUNCHER_CATEGORY} -n {pkg}/.MainActivity) && {started}"
+        )
+    lines.append(f"monkey -p {pkg} -c {_LAUNCHER_CATEGORY} 1")
+    lines.append(")")
+    return "\n".join(lines)
+
+
+# Launcher activities rarely change, so they are cached in memory and on disk:
+# (device_id, package) -> (activity, resolved_at). Entries expire after a day.
+_ACTIVITY_CACHE: dict[tuple[str | None, str], tuple[str, float]] = {}
+_ACTIVITY_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "phone-mcp", "launcher.json"
+)
+_ACTIVITY_CACHE_TTL = 24 * 60 * 60
+_activity_cache_lock = threading.Lock()
+_activity_cache_loaded = False
+
+
+def _get_cached_activity(device_id: str | None, package: str) -> str | None:
+    """Get the cached launcher activity for a package, if still fresh."""
+    with _activity_cache_lock:
+        _load_activity_cache()
+        entry = _ACTIVITY_CACHE.get((device_id, package))
+    if entry and time.time() - entry[1] < _ACTIVITY_CACHE_TTL:
+        return entry[0]
+    return None
+
+
+def _set_cached_activity(device_id: str | None, package: str, activity: str) -> None:
+    """Store (or with an empty activity, forget) a resolved launcher activity."""
+    with _activity_cache_lock:
+        _load_activity_cache()
+        if activity:
+            _ACTIVITY_CACHE[(device_id, package)] = (activity, time.time())
+        elif _ACTIVITY_CACHE.pop((device_id, package), None) is None:
+            return
+        _save_activity_cache()
+
+
+def _load_activity_cache() -> None:
+    """Load the on-disk activity cache once. Caller must hold the lock."""
+    global _activity_cache_loaded
+    if _activity_cache_loaded:
+        return
+    _activity_cache_loaded = True
+
+    try:
+        with open(_ACTIVITY_CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+        for serial, packages in data.items():
+            for package, (activity, resolved_at) in packages.items():
+                _ACTIVITY_CACHE[(serial or None, package)] = (activity, float(resolved_at))
+    except (OSError, ValueError, TypeError, AttributeError):
+        pass
+
+
+def _save_activity_cache() -> None:
+    """Write the activity cache to disk. Caller must hold the lock."""
+    now = time.time()
+    data: dict[str, dict[str, list]] = {}
+    for (device_id, package), (activity, resolved_at) in _ACTIVITY_CACHE.items():
+        if now - resolved_at < _ACTIVITY_CACHE_TTL:
+            data.setdefault(device_id or "", {})[package] = [activity, resolved_at]
+
+    # Write a temp file and rename it over the cache, so a crash or another
+    # server process writing at the same time never leaves a truncated file.
+    cache_dir = os.path.dirname(_ACTIVITY_CACHE_FILE)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, _ACTIVITY_CACHE_FILE)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+# Keywords that can be passed to grep on the device without surprises.
+_SAFE_KEYWORD_RE = re.compile(r"[A-Za-z0-9._-]+")
 
 
 def search_installed_apps(keyword: str, device_id: str | None = None) -> list[str]:
@@ -328,21 +323,25 @@ def search_installed_apps(keyword: str, device_id: str | None = None) -> list[st
     Returns:
         List of matching package names
     """
-    adb_prefix = _get_adb_prefix(device_id)
-
-    result = subprocess.run(
-        adb_prefix + ["shell", "pm", "list", "packages"],
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-    )
-
-    if result.returncode != 0:
+    shell = get_shell(device_id)
+    if _SAFE_KEYWORD_RE.fullmatch(keyword):
+        # 在设备端先过滤，只传回匹配的包名; grep 无匹配时返回 1
+        returncode, output = shell.run(
+            f"pm list packages | grep -i -F -- {shlex.quote(keyword)}"
+        )
+        if returncode == 1 and not output.strip():
+            return []
+        if returncode != 0:
+            returncode, output = shell.run("pm list packages")
+    else:
+        returncode, output = shell.run("pm list packages")
+
+    if returncode != 0:
         return []
 
     packages = []
     keyword_lower = keyword.lower()
-    for line in result.stdout.strip().split('\n'):
+    for line in output.strip().split('\n'):
         if line.startswith('package:'):
             pkg = line[8:]  # Remove "package:" prefix
             if keyword_lower in pkg.lower():
@@ -393,7 +392,32 @@ def press_key(key: str, device_id: str | None = None, delay: float = 0.5) -> Non
         device_id: Optional ADB device ID
         delay: Delay after pressing the key
     """
-    adb_prefix = _get_adb_prefix(device_id)
+    get_shell(device_id).run(_key_cmd(key))
+    time.sleep(delay)
+
+
+def _tap_cmd(x: int, y: int) -> str:
+    return "input tap %d %d" % (x, y)
+
+
+def _swipe_cmd(
+    start_x: int, start_y: int, end_x: int, end_y: int, duration_ms: int | None
+) -> str:
+    if duration_ms is None:
+        dist_sq = (start_x - end_x) ** 2 + (start_y - end_y) ** 2
+        duration_ms = int(dist_sq / 1000)
+        duration_ms = max(1000, min(duration_ms, 2000))
+    return "input swipe %d %d %d %d %d" % (start_x, start_y, end_x, end_y, duration_ms)
+
+
+# Ready-made commands for the named keys, so common presses skip normalization.
+_KEY_COMMANDS = {name: f"input keyevent {code}" for name, code in KEY_MAP.items()}
+
+
+def _key_cmd(key: str) -> str:
+    cmd = _KEY_COMMANDS.get(key)
+    if cmd is not None:
+        return cmd
 
     # 转换按键名称为键码
     key_lower = key.lower().strip()
@@ -403,16 +427,253 @@ def press_key(key: str, device_id: str | None = None, delay: float = 0.5) -> Non
     if not keycode.isdigit():
         keycode = f"KEYCODE_{keycode.upper()}"
 
-    subprocess.run(
-        adb_prefix + ["shell", "input", "keyevent", keycode],
-        capture_output=True,
+    return f"input keyevent {shlex.quote(keycode)}"
+
+
+# ============================================================================
+# Async variants
+# ============================================================================
+#
+# Same commands and delays as the functions above, but the post-action delay
+# is an asyncio.sleep, so an async server is not holding a worker thread while
+# it waits for the UI to settle. A delay of 0 skips the wait entirely. Device
+# commands still go through the persistent per-device shell (a handoff to a
+# worker thread), which is cheaper than spawning an adb client per call.
+
+
+async def _run_async(device_id: str | None, cmd: str) -> tuple[int, str]:
+    return await asyncio.to_thread(get_shell(device_id).run, cmd)
+
+
+async def _sleep(delay: float) -> None:
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+async def get_current_app_async(device_id: str | None = None) -> str:
+    """Async version of get_current_app()."""
+    return await asyncio.to_thread(get_current_app, device_id)
+
+
+async def launch_app_async(
+    app_name: str,
+    device_id: str | None = None,
+    delay: float | None = None,
+    refresh: bool = False,
+) -> bool:
+    """Async version of launch_app()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_launch_delay
+
+    if app_name not in APP_PACKAGES:
+        return False
+
+    await asyncio.to_thread(
+        _launch_package, APP_PACKAGES[app_name], device_id, True, refresh
     )
-    time.sleep(delay)
+    await _sleep(delay)
+    return True
+
+
+async def launch_app_by_package_async(
+    package: str,
+    device_id: str | None = None,
+    delay: float | None = None,
+    refresh: bool = False,
+) -> bool:
+    """Async version of launch_app_by_package()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_launch_delay
 
+    output = await asyncio.to_thread(_launch_package, package, device_id, False, refresh)
+    await _sleep(delay)
+    return "No activities found" not in output
 
-def _get_adb_prefix(device_id: str | None) -> list:
-    """Get ADB command prefix with optional device specifier."""
-    if device_id:
-        return ["adb", "-s", device_id]
-    return ["adb"]
 
+async def search_installed_apps_async(
+    keyword: str, device_id: str | None = None
+) -> list[str]:
+    """Async version of search_installed_apps()."""
+    return await asyncio.to_thread(search_installed_apps, keyword, device_id)
+
+
+async def tap_async(
+    x: int, y: int, device_id: str | None = None, delay: float | None = None
+) -> None:
+    """Async version of tap()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_tap_delay
+
+    await _run_async(device_id, _tap_cmd(x, y))
+    await _sleep(delay)
+
+
+async def double_tap_async(
+    x: int, y: int, device_id: str | None = None, delay: float | None = None
+) -> None:
+    """Async version of double_tap()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_double_tap_delay
+
+    await _run_async(device_id, _tap_cmd(x, y))
+    await _sleep(TIMING_CONFIG.device.double_tap_interval)
+    await _run_async(device_id, _tap_cmd(x, y))
+    await _sleep(delay)
+
+
+async def long_press_async(
+    x: int,
+    y: int,
+    duration_ms: int = 3000,
+    device_id: str | None = None,
+    delay: float | None = None,
+) -> None:
+    """Async version of long_press()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_long_press_delay
+
+    await _run_async(device_id, _swipe_cmd(x, y, x, y, duration_ms))
+    await _sleep(delay)
+
+
+async def swipe_async(
+    start_x: int,
+    start_y: int,
+    end_x: int,
+    end_y: int,
+    duration_ms: int | None = None,
+    device_id: str | None = None,
+    delay: float | None = None,
+) -> None:
+    """Async version of swipe()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_swipe_delay
+
+    await _run_async(device_id, _swipe_cmd(start_x, start_y, end_x, end_y, duration_ms))
+    await _sleep(delay)
+
+
+async def back_async(device_id: str | None = None, delay: float | None = None) -> None:
+    """Async version of back()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_back_delay
+
+    await _run_async(device_id, "input keyevent 4")
+    await _sleep(delay)
+
+
+async def home_async(device_id: str | None = None, delay: float | None = None) -> None:
+    """Async version of home()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_home_delay
+
+    await _run_async(device_id, "input keyevent KEYCODE_HOME")
+    await _sleep(delay)
+
+
+async def press_key_async(key: str, device_id: str | None = None, delay: float = 0.5) -> None:
+    """Async version of press_key()."""
+    await _run_async(device_id, _key_cmd(key))
+    await _sleep(delay)
+
+
+# ============================================================================
+# Input scripts
+# ============================================================================
+#
+# A run of plain input actions can be sent to the device as one shell script,
+# with the waits between them running on-device as ``sleep``: one persistent
+# shell round-trip for the whole run instead of one per action. Each
+# *_commands() helper returns the same command and default delay as the
+# matching action function above.
+
+
+def tap_commands(x: int, y: int, delay: float | None = None) -> list[str]:
+    """Shell commands equivalent to tap()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_tap_delay
+    return [_tap_cmd(x, y), *_sleep_cmds(delay)]
+
+
+def double_tap_commands(x: int, y: int, delay: float | None = None) -> list[str]:
+    """Shell commands equivalent to double_tap()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_double_tap_delay
+    return [
+        _tap_cmd(x, y),
+        *_sleep_cmds(TIMING_CONFIG.device.double_tap_interval),
+        _tap_cmd(x, y),
+        *_sleep_cmds(delay),
+    ]
+
+
+def long_press_commands(
+    x: int, y: int, duration_ms: int = 3000, delay: float | None = None
+) -> list[str]:
+    """Shell commands equivalent to long_press()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_long_press_delay
+    return [_swipe_cmd(x, y, x, y, duration_ms), *_sleep_cmds(delay)]
+
+
+def swipe_commands(
+    start_x: int,
+    start_y: int,
+    end_x: int,
+    end_y: int,
+    duration_ms: int | None = None,
+    delay: float | None = None,
+) -> list[str]:
+    """Shell commands equivalent to swipe()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_swipe_delay
+    return [_swipe_cmd(start_x, start_y, end_x, end_y, duration_ms), *_sleep_cmds(delay)]
+
+
+def back_commands(delay: float | None = None) -> list[str]:
+    """Shell commands equivalent to back()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_back_delay
+    return ["input keyevent 4", *_sleep_cmds(delay)]
+
+
+def home_commands(delay: float | None = None) -> list[str]:
+    """Shell commands equivalent to home()."""
+    if delay is None:
+        delay = TIMING_CONFIG.device.default_home_delay
+    return ["input keyevent KEYCODE_HOME", *_sleep_cmds(delay)]
+
+
+def press_key_commands(key: str, delay: float = 0.5) -> list[str]:
+    """Shell commands equivalent to press_key()."""
+    return [_key_cmd(key), *_sleep_cmds(delay)]
+
+
+def sleep_commands(seconds: float) -> list[str]:
+    """Shell commands that wait on the device."""
+    return _sleep_cmds(seconds)
+
+
+async def run_input_script_async(
+    commands: list[str], device_id: str | None = None
+) -> None:
+    """
+    Run a list of *_commands() output on the device in one round-trip.
+
+    The script stops at the first command that fails.
+
+    Raises:
+        RuntimeError: If a command in the script exited non-zero.
+    """
+    if not commands:
+        return
+    rc, output = await _run_async(device_id, " && ".join(commands))
+    if rc != 0:
+        raise RuntimeError(f"Input script failed (exit {rc}): {output.strip()}")
+
+
+def _sleep_cmds(seconds: float) -> list[str]:
+    # toybox sleep accepts fractional seconds; millisecond precision is plenty.
+    if seconds <= 0:
+        return []
+    return ["sleep " + ("%.3f" % seconds).rstrip("0").rstrip(".")]
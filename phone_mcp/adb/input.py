@@ -1,7 +1,11 @@
 """Input utilities for Android device text input."""
 
 import base64
-import subprocess
+import shlex
+
+from phone_mcp.adb._shell_pool import get_shell
+
+_ADB_IME = "com.android.adbkeyboard/.AdbIME"
 
 
 def type_text(text: str, device_id: str | None = None) -> None:
@@ -16,35 +20,16 @@ def type_text(text: str, device_id: str | None = None) -> None:
         Requires ADB Keyboard to be installed on the device.
         See: https://github.com/nicnocquee/AdbKeyboard
     """
-    adb_prefix = _get_adb_prefix(device_id)
     encoded_text = base64.b64encode(text.encode("utf-8")).decode("utf-8")
 
-    subprocess.run(
-        adb_prefix
-        + [
-            "shell",
-            "am",
-            "broadcast",
-            "-a",
-            "ADB_INPUT_B64",
-            "--es",
-            "msg",
-            encoded_text,
-        ],
-        capture_output=True,
-        text=True,
+    get_shell(device_id).run(
+        f"am broadcast -a ADB_INPUT_B64 --es msg {shlex.quote(encoded_text)}"
     )
 
 
 def clear_text(device_id: str | None = None) -> None:
     """Clear text in the currently focused input field."""
-    adb_prefix = _get_adb_prefix(device_id)
-
-    subprocess.run(
-        adb_prefix + ["shell", "am", "broadcast", "-a", "ADB_CLEAR_TEXT"],
-        capture_output=True,
-        text=True,
-    )
+    get_shell(device_id).run("am broadcast -a ADB_CLEAR_TEXT")
 
 
 def detect_and_set_adb_keyboard(device_id: str | None = None) -> str:
@@ -54,21 +39,13 @@ def detect_and_set_adb_keyboard(device_id: str | None = None) -> str:
     Returns:
         The original keyboard IME identifier for later restoration.
     """
-    adb_prefix = _get_adb_prefix(device_id)
+    shell = get_shell(device_id)
 
-    result = subprocess.run(
-        adb_prefix + ["shell", "settings", "get", "secure", "default_input_method"],
-        capture_output=True,
-        text=True,
-    )
-    current_ime = (result.stdout + result.stderr).strip()
+    _, output = shell.run("settings get secure default_input_method 2>&1")
+    current_ime = output.strip()
 
-    if "com.android.adbkeyboard/.AdbIME" not in current_ime:
-        subprocess.run(
-            adb_prefix + ["shell", "ime", "set", "com.android.adbkeyboard/.AdbIME"],
-            capture_output=True,
-            text=True,
-        )
+    if _ADB_IME not in current_ime:
+        shell.run(f"ime set {_ADB_IME}")
 
     # Warm up the keyboard
     type_text("", device_id)
@@ -78,16 +55,4 @@ def detect_and_set_adb_keyboard(device_id: str | None = None) -> str:
 
 def restore_keyboard(ime: str, device_id: str | None = None) -> None:
     """Restore the original keyboard IME."""
-    adb_prefix = _get_adb_prefix(device_id)
-
-    subprocess.run(
-        adb_prefix + ["shell", "ime", "set", ime], capture_output=True, text=True
-    )
-
-
-def _get_adb_prefix(device_id: str | None) -> list:
-    """Get ADB command prefix with optional device specifier."""
-    if device_id:
-        return ["adb", "-s", device_id]
-    return ["adb"]
-
+    get_shell(device_id).run(f"ime set {shlex.quote(ime)}")
@@ -1,23 +1,39 @@
 """Screenshot utilities for capturing Android device screen."""
 
+import asyncio
 import base64
+import functools
 import os
+import struct
 import subprocess
+import sys
 import tempfile
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from io import BytesIO
 
 from PIL import Image
 
+from phone_mcp.adb._jpeg import encode_jpeg
+from phone_mcp.adb._process import read_adb_output, run_adb
+
 
 @dataclass
 class Screenshot:
     """Represents a captured screenshot."""
-    base64_data: str
+    raw_bytes: bytes = field(repr=False)
     width: int
     height: int
     is_sensitive: bool = False
+    format: str = "png"  # encoding of raw_bytes: "png" or "jpeg"
+    _base64: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def base64_data(self) -> str:
+        """The image base64-encoded (computed on first access)."""
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self.raw_bytes).decode("ascii")
+        return self._base64
 
 
 def get_screenshot(device_id: str | None = None, timeout: int = 10) -> Screenshot:
@@ -29,14 +45,14 @@ def get_screenshot(device_id: str | None = None, timeout: int = 10) -> Screensho
         timeout: Timeout in seconds for screenshot operations.
 
     Returns:
-        Screenshot object containing base64 data and dimensions.
+        Screenshot object containing the PNG bytes and dimensions.
     """
     temp_path = os.path.join(tempfile.gettempdir(), f"screenshot_{uuid.uuid4()}.png")
     adb_prefix = _get_adb_prefix(device_id)
 
     try:
         result = subprocess.run(
-            adb_prefix + ["shell", "screencap", "-p", "/sdcard/tmp.png"],
+            adb_prefix + ("shell", "screencap", "-p", "/sdcard/tmp.png"),
             capture_output=True,
             text=True,
             timeout=timeout,
@@ -47,51 +63,191 @@ def get_screenshot(device_id: str | None = None, timeout: int = 10) -> Screensho
             return _create_fallback_screenshot(is_sensitive=True)
 
         subprocess.run(
-            adb_prefix + ["pull", "/sdcard/tmp.png", temp_path],
+            adb_prefix + ("pull", "/sdcard/tmp.png", temp_path),
             capture_output=True,
             text=True,
             timeout=5,
         )
 
-        if not os.path.exists(temp_path):
-            return _create_fallback_screenshot(is_sensitive=False)
+        return _load_screenshot(temp_path)
+
+    except Exception as e:
+        print(f"Screenshot error: {e}", file=sys.stderr)
+        return _create_fallback_screenshot(is_sensitive=False)
 
-        img = Image.open(temp_path)
-        width, height = img.size
 
-        buffered = BytesIO()
-        img.save(buffered, format="PNG")
-        base64_data = base64.b64encode(buffered.getvalue()).decode("utf-8")
+async def get_screenshot_async(
+    device_id: str | None = None, timeout: int = 10
+) -> Screenshot:
+    """
+    Async version of get_screenshot().
 
-        os.remove(temp_path)
+    The adb calls are awaited on the event loop; only the image decoding
+    runs in a worker thread.
+    """
+    temp_path = os.path.join(tempfile.gettempdir(), f"screenshot_{uuid.uuid4()}.png")
 
-        return Screenshot(
-            base64_data=base64_data, width=width, height=height, is_sensitive=False
+    try:
+        _, output = await run_adb(
+            ["shell", "screencap", "-p", "/sdcard/tmp.png"],
+            device_id,
+            timeout,
+            merge_stderr=True,
         )
 
+        if b"Status: -1" in output or b"Failed" in output:
+            return _create_fallback_screenshot(is_sensitive=True)
+
+        await run_adb(["pull", "/sdcard/tmp.png", temp_path], device_id, 5)
+
+        return await asyncio.to_thread(_load_screenshot, temp_path)
+
+    except Exception as e:
+        print(f"Screenshot error: {e}", file=sys.stderr)
+        return _create_fallback_screenshot(is_sensitive=False)
+
+
+def get_screenshot_bytes(device_id: str | None = None, timeout: int = 10) -> bytes:
+    """
+    Capture the screen as raw PNG bytes.
+
+    Streams ``adb exec-out screencap -p`` straight from the device, with no
+    temporary file, re-encoding or base64 step. Returns a black PNG if the
+    capture fails (e.g. on screens protected with FLAG_SECURE).
+    """
+    try:
+        returncode, data = read_adb_output(["exec-out", "screencap", "-p"], device_id, timeout)
+    except Exception as e:
+        print(f"Screenshot error: {e}", file=sys.stderr)
+        return _fallback_png_bytes()
+
+    if returncode != 0 or not data.startswith(_PNG_SIGNATURE):
+        return _fallback_png_bytes()
+    return bytes(data)
+
+
+async def get_screenshot_bytes_async(
+    device_id: str | None = None, timeout: int = 10
+) -> bytes:
+    """Async version of get_screenshot_bytes()."""
+    try:
+        returncode, data = await run_adb(["exec-out", "screencap", "-p"], device_id, timeout)
+    except Exception as e:
+        print(f"Screenshot error: {e}", file=sys.stderr)
+        return _fallback_png_bytes()
+
+    if returncode != 0 or not data.startswith(_PNG_SIGNATURE):
+        return _fallback_png_bytes()
+    return data
+
+
+async def get_screenshot_jpeg_async(
+    device_id: str | None = None, quality: int = 60, timeout: int = 10
+) -> bytes | None:
+    """
+    Capture the screen as JPEG bytes encoded on the host.
+
+    Reads raw ``screencap`` output (no ``-p``) and encodes it straight to
+    JPEG, skipping PNG compression on the device and PNG decoding here.
+
+    Returns:
+        The JPEG bytes, or None if the capture failed or the framebuffer
+        format is not supported; callers then fall back to
+        get_screenshot_bytes_async().
+    """
+    try:
+        returncode, data = await run_adb(["exec-out", "screencap"], device_id, timeout)
     except Exception as e:
-        print(f"Screenshot error: {e}")
+        print(f"Screenshot error: {e}", file=sys.stderr)
+        return None
+
+    if returncode != 0 or not data:
+        return None
+    return await asyncio.to_thread(_raw_screencap_to_jpeg, data, quality)
+
+
+def _raw_screencap_to_jpeg(data: bytes, quality: int) -> bytes | None:
+    """Encode raw screencap output as JPEG, or None if unsupported."""
+    pixels = _raw_screencap_to_array(data)
+    if pixels is None:
+        return None
+    return encode_jpeg(pixels, quality=quality)
+
+
+# screencap raw pixel formats (android.graphics.PixelFormat) -> RGB channel order.
+_RAW_RGB_CHANNELS = {
+    1: slice(0, 3),  # RGBA_8888
+    2: slice(0, 3),  # RGBX_8888
+    5: slice(2, None, -1),  # BGRA_8888
+}
+
+
+def _raw_screencap_to_array(data: bytes):
+    """Convert raw screencap output to an RGB array, or None if unsupported."""
+    import numpy as np
+
+    if len(data) < 12:
+        return None
+
+    # Header is width, height, format (+ colorspace on Android 8+) as uint32.
+    width, height, pixel_format = struct.unpack_from("<III", data)
+    header_size = len(data) - width * height * 4
+    channels = _RAW_RGB_CHANNELS.get(pixel_format)
+    if header_size not in (12, 16) or channels is None:
+        return None
+
+    pixels = np.frombuffer(data, dtype=np.uint8, offset=header_size)
+    # One copy to drop alpha into the contiguous layout PaddleOCR expects.
+    return np.ascontiguousarray(pixels.reshape(height, width, 4)[:, :, channels])
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+_FALLBACK_SIZE = (1080, 2400)
+
+
+@functools.lru_cache(maxsize=1)
+def _fallback_png_bytes() -> bytes:
+    """PNG bytes of the black fallback image."""
+    black_img = Image.new("RGB", _FALLBACK_SIZE, color="black")
+    buffered = BytesIO()
+    black_img.save(buffered, format="PNG")
+    return buffered.getvalue()
+
+
+def _load_screenshot(temp_path: str) -> Screenshot:
+    """Load a pulled screenshot file into a Screenshot and delete the file."""
+    if not os.path.exists(temp_path):
         return _create_fallback_screenshot(is_sensitive=False)
 
+    with open(temp_path, "rb") as f:
+        raw_bytes = f.read()
+    os.remove(temp_path)
 
-def _get_adb_prefix(device_id: str | None) -> list:
+    # screencap -p already wrote a PNG; only the header is parsed for the size.
+    img = Image.open(BytesIO(raw_bytes))
+    width, height = img.size
+
+    return Screenshot(
+        raw_bytes=raw_bytes, width=width, height=height, is_sensitive=False
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_adb_prefix(device_id: str | None) -> tuple[str, ...]:
     """Get ADB command prefix with optional device specifier."""
     if device_id:
-        return ["adb", "-s", device_id]
-    return ["adb"]
+        return ("adb", "-s", device_id)
+    return ("adb",)
 
 
 def _create_fallback_screenshot(is_sensitive: bool) -> Screenshot:
     """Create a black fallback image when screenshot fails."""
-    default_width, default_height = 1080, 2400
-
-    black_img = Image.new("RGB", (default_width, default_height), color="black")
-    buffered = BytesIO()
-    black_img.save(buffered, format="PNG")
-    base64_data = base64.b64encode(buffered.getvalue()).decode("utf-8")
+    default_width, default_height = _FALLBACK_SIZE
 
     return Screenshot(
-        base64_data=base64_data,
+        raw_bytes=_fallback_png_bytes(),
         width=default_width,
         height=default_height,
         is_sensitive=is_sensitive,
@@ -7,13 +7,17 @@ This module provides functionality to:
 4. Calculate element center coordinates for precise tapping
 """
 
-import subprocess
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+import asyncio
+import functools
+import sys
+import xml.parsers.expat
+from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
+from phone_mcp.adb._shell_pool import get_shell
 
-@dataclass
+
+@dataclass(slots=True)
 class UIElement:
     """Represents a UI element on the screen."""
 
@@ -27,12 +31,23 @@ class UIElement:
     enabled: bool
     focused: bool
     selected: bool
-
-    @property
-    def center(self) -> Tuple[int, int]:
-        """Calculate the center point of the element."""
+    # Lowercased text / content_desc for case-insensitive lookups.
+    text_lc: str = field(init=False, repr=False, compare=False)
+    desc_lc: str = field(init=False, repr=False, compare=False)
+    # resource_id without the "package:id/" prefix, e.g. "send_btn".
+    simple_id: str = field(init=False, repr=False, compare=False)
+    # class_name without the package, e.g. "TextView".
+    class_short: str = field(init=False, repr=False, compare=False)
+    # Center point of the element, computed from bounds at construction.
+    center: Tuple[int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.text_lc = self.text.lower()
+        self.desc_lc = self.content_desc.lower()
+        self.simple_id = _tail(self.resource_id, "/")
+        self.class_short = _tail(self.class_name, ".")
         left, top, right, bottom = self.bounds
-        return ((left + right) // 2, (top + bottom) // 2)
+        self.center = ((left + right) // 2, (top + bottom) // 2)
 
     @property
     def width(self) -> int:
@@ -64,82 +79,110 @@ class UIElement:
 
 def get_ui_hierarchy_xml(device_id: str | None = None, timeout: int = 10) -> str:
     """Dump UI hierarchy XML from the device."""
-    adb_prefix = _get_adb_prefix(device_id)
+    return _get_ui_hierarchy_bytes(device_id, timeout).decode("utf-8", errors="replace")
+
 
-    subprocess.run(
-        adb_prefix + ["shell", "uiautomator", "dump", "/sdcard/ui_dump.xml"],
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-    )
+def _get_ui_hierarchy_bytes(device_id: str | None, timeout: int) -> bytes:
+    """Dump UI hierarchy XML as the raw UTF-8 bytes produced by uiautomator."""
+    # Dump and read back in one round-trip on the persistent shell. Dumping to
+    # /dev/tty would skip the file, but it needs a PTY, which adb shell only
+    # allocates for interactive terminals.
+    _, output = get_shell(device_id).run_bytes(_DUMP_CMD, timeout=timeout)
+    return _extract_hierarchy(output)
 
-    result = subprocess.run(
-        adb_prefix + ["shell", "cat", "/sdcard/ui_dump.xml"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-    )
 
-    return result.stdout
+_DUMP_CMD = "uiautomator dump /sdcard/ui_dump.xml >/dev/null && cat /sdcard/ui_dump.xml"
+
+
+def _extract_hierarchy(output: bytes) -> bytes:
+    """Strip anything adb or uiautomator printed around the XML document."""
+    start = output.find(b"<?xml")
+    if start < 0:
+        start = output.find(b"<hierarchy")
+    if start < 0:
+        return output
+    end = output.rfind(b"</hierarchy>")
+    if end < 0:
+        return output[start:]
+    return output[start:end + len(b"</hierarchy>")]
 
 
 def parse_ui_elements(
-    xml_content: str,
+    xml_content: str | bytes,
     clickable_only: bool = True,
     include_all_with_text: bool = True,
 ) -> List[UIElement]:
-    """Parse UI hierarchy XML and extract elements."""
+    """Parse UI hierarchy XML (str, or UTF-8 bytes as dumped) and extract elements."""
     elements = []
 
+    index = 0
     try:
-        root = ET.fromstring(xml_content)
-    except ET.ParseError:
-        return elements
+        for attrib in _node_attribs(xml_content):
+            # Read only what the filters need first; most container nodes are
+            # rejected here.
+            bounds_str = attrib.get("bounds", "[0,0][0,0]")
+            bounds = _parse_bounds(bounds_str)
 
-    index = 0
-    for node in root.iter("node"):
-        text = node.get("text", "")
-        content_desc = node.get("content-desc", "")
-        resource_id = node.get("resource-id", "")
-        class_name = node.get("class", "")
-        clickable = node.get("clickable", "false") == "true"
-        enabled = node.get("enabled", "true") == "true"
-        focused = node.get("focused", "false") == "true"
-        selected = node.get("selected", "false") == "true"
-
-        bounds_str = node.get("bounds", "[0,0][0,0]")
-        bounds = _parse_bounds(bounds_str)
-
-        if bounds[2] <= bounds[0] or bounds[3] <= bounds[1]:
-            continue
-
-        has_identifier = bool(text or content_desc or resource_id)
-
-        if clickable_only:
-            if not clickable and not (include_all_with_text and has_identifier):
+            if bounds[2] <= bounds[0] or bounds[3] <= bounds[1]:
                 continue
 
-        if not has_identifier and not clickable:
-            continue
-
-        element = UIElement(
-            index=index,
-            text=text,
-            content_desc=content_desc,
-            resource_id=resource_id,
-            class_name=class_name,
-            bounds=bounds,
-            clickable=clickable,
-            enabled=enabled,
-            focused=focused,
-            selected=selected,
-        )
-        elements.append(element)
-        index += 1
+            clickable = attrib.get("clickable", "false") == "true"
+            text = attrib.get("text", "")
+            content_desc = attrib.get("content-desc", "")
+            # Class names and IDs repeat across nodes and across dumps; interned
+            # copies are shared by every cached element list.
+            resource_id = sys.intern(attrib.get("resource-id", ""))
+
+            has_identifier = bool(text or content_desc or resource_id)
+
+            if clickable_only:
+                if not clickable and not (include_all_with_text and has_identifier):
+                    continue
+
+            if not has_identifier and not clickable:
+                continue
+
+            element = UIElement(
+                index=index,
+                text=text,
+                content_desc=content_desc,
+                resource_id=resource_id,
+                class_name=sys.intern(attrib.get("class", "")),
+                bounds=bounds,
+                clickable=clickable,
+                enabled=attrib.get("enabled", "true") == "true",
+                focused=attrib.get("focused", "false") == "true",
+                selected=attrib.get("selected", "false") == "true",
+            )
+            elements.append(element)
+            index += 1
+    except xml.parsers.expat.ExpatError:
+        return []
 
     return elements
 
 
+def _node_attribs(xml_content: str | bytes) -> List[dict]:
+    """
+    Collect the attributes of every <node> in document order.
+
+    Uses the expat parser directly: uiautomator dumps only carry data in
+    attributes, so there is no need to build an ElementTree first. Start
+    tags arrive parent-before-children, the same order as root.iter().
+    """
+    attribs: List[dict] = []
+    append = attribs.append
+
+    def start_element(name: str, attrs: dict) -> None:
+        if name == "node":
+            append(attrs)
+
+    parser = xml.parsers.expat.ParserCreate()
+    parser.StartElementHandler = start_element
+    parser.Parse(xml_content, True)
+    return attribs
+
+
 # Minimum number of elements to consider XML dump "useful".
 # If fewer elements are returned, we treat it as a poor dump.
 _XML_MIN_ELEMENTS = 2
@@ -188,13 +231,85 @@ def get_ui_elements(
         return _get_elements_via_xml(device_id, clickable_only, timeout)
 
 
+async def get_ui_elements_async(
+    device_id: str | None = None,
+    clickable_only: bool = True,
+    timeout: int = 10,
+    mode: str = "xml",
+    fresh: bool = False,
+) -> List[UIElement]:
+    """Async version of get_ui_elements for use inside the MCP event loop.
+
+    The XML dump and parsing run in a worker thread, and OCR goes through
+    ocr_get_ui_elements_async, so the event loop is never blocked.
+    Arguments and fallback behaviour are the same as get_ui_elements.
+
+    Concurrent calls with the same device, clickable_only and mode share
+    one in-flight dump instead of each running uiautomator on the device.
+    Pass fresh=True after an input action: an in-flight dump may have
+    started before it, so the call starts its own dump (which later
+    callers then share) instead of joining.
+    """
+    key = (device_id, clickable_only, mode)
+    future = _inflight_dumps.get(key)
+    if future is None or fresh:
+        future = asyncio.ensure_future(
+            _get_ui_elements_async(device_id, clickable_only, timeout, mode)
+        )
+        _inflight_dumps[key] = future
+        future.add_done_callback(lambda f: _drop_inflight_dump(key, f))
+
+    # Shield so one cancelled caller does not cancel the shared dump.
+    return list(await asyncio.shield(future))
+
+
+# In-flight dumps keyed by (device_id, clickable_only, mode).
+_inflight_dumps: dict[tuple, asyncio.Future] = {}
+
+
+def _drop_inflight_dump(key: tuple, future: asyncio.Future) -> None:
+    # A fresh dump may have replaced this one under the same key.
+    if _inflight_dumps.get(key) is future:
+        del _inflight_dumps[key]
+
+
+async def _get_ui_elements_async(
+    device_id: str | None, clickable_only: bool, timeout: int, mode: str
+) -> List[UIElement]:
+    if mode == "ocr":
+        return await _get_elements_via_ocr_async(device_id, timeout)
+
+    if mode == "xml":
+        return await asyncio.to_thread(
+            _get_elements_via_xml, device_id, clickable_only, timeout
+        )
+
+    # mode == "auto": try XML first, fallback to OCR
+    try:
+        elements = await asyncio.to_thread(
+            _get_elements_via_xml, device_id, clickable_only, timeout
+        )
+        if len(elements) >= _XML_MIN_ELEMENTS:
+            return elements
+    except Exception:
+        pass
+
+    try:
+        return await _get_elements_via_ocr_async(device_id, timeout)
+    except Exception:
+        return await asyncio.to_thread(
+            _get_elements_via_xml, device_id, clickable_only, timeout
+        )
+
+
 def _get_elements_via_xml(
     device_id: str | None,
     clickable_only: bool,
     timeout: int,
 ) -> List[UIElement]:
     """Internal: get elements via uiautomator XML dump."""
-    xml_content = get_ui_hierarchy_xml(device_id, timeout)
+    # expat decodes the dump's UTF-8 itself, so skip a separate decode here.
+    xml_content = _get_ui_hierarchy_bytes(device_id, timeout)
     return parse_ui_elements(xml_content, clickable_only)
 
 
@@ -207,6 +322,15 @@ def _get_elements_via_ocr(
     return ocr_get_ui_elements(device_id=device_id, timeout=timeout)
 
 
+async def _get_elements_via_ocr_async(
+    device_id: str | None,
+    timeout: int,
+) -> List[UIElement]:
+    """Internal: get elements via OCR without blocking the event loop."""
+    from phone_mcp.adb.ocr import ocr_get_ui_elements_async
+    return await ocr_get_ui_elements_async(device_id=device_id, timeout=timeout)
+
+
 def find_element_by_text(
     elements: List[UIElement],
     text: str,
@@ -216,8 +340,8 @@ def find_element_by_text(
     text_lower = text.lower()
 
     for element in elements:
-        element_text = element.text.lower()
-        element_desc = element.content_desc.lower()
+        element_text = element.text_lc
+        element_desc = element.desc_lc
 
         if exact_match:
             if element_text == text_lower or element_desc == text_lower:
@@ -229,21 +353,90 @@ def find_element_by_text(
     return None
 
 
+def find_element_by_any_text(
+    elements: List[UIElement],
+    texts: List[str],
+    exact_match: bool = False,
+) -> Optional[UIElement]:
+    """
+    Find the first element whose text or content-desc matches any of texts.
+
+    For substring matching with several candidates, the optional
+    pyahocorasick package (pip install phone-mcp[speedups]) builds a single
+    automaton over the queries, so each element text is scanned once no
+    matter how many candidates are given.
+    """
+    queries = {text.lower() for text in texts}
+    if not queries:
+        return None
+
+    if exact_match:
+        for element in elements:
+            if element.text_lc in queries or element.desc_lc in queries:
+                return element
+        return None
+
+    ahocorasick = _get_ahocorasick()
+    if ahocorasick is not None and len(queries) > 1 and "" not in queries:
+        automaton = ahocorasick.Automaton()
+        for query in queries:
+            automaton.add_word(query, query)
+        automaton.make_automaton()
+        for element in elements:
+            for value in (element.text_lc, element.desc_lc):
+                if next(automaton.iter(value), None) is not None:
+                    return element
+        return None
+
+    for element in elements:
+        for query in queries:
+            if query in element.text_lc or query in element.desc_lc:
+                return element
+    return None
+
+
+# None: not probed yet, False: unavailable, otherwise the ahocorasick module.
+_ahocorasick = None
+
+
+def _get_ahocorasick():
+    global _ahocorasick
+    if _ahocorasick is None:
+        try:
+            import ahocorasick
+            _ahocorasick = ahocorasick
+        except ImportError:
+            _ahocorasick = False
+    return _ahocorasick or None
+
+
 def find_element_by_resource_id(
     elements: List[UIElement],
     resource_id: str,
     partial_match: bool = True,
 ) -> Optional[UIElement]:
-    """Find an element by its resource ID."""
-    for element in elements:
-        if partial_match:
-            if resource_id in element.resource_id:
-                return element
-        else:
+    """
+    Find an element by its resource ID.
+
+    With partial_match, a bare ID such as "send_btn" prefers the element
+    whose simple_id equals it over earlier elements that merely contain it
+    (e.g. "send_btn_icon"); otherwise the first substring match is returned.
+    """
+    if not partial_match:
+        for element in elements:
             if element.resource_id == resource_id:
                 return element
+        return None
 
-    return None
+    first_match = None
+    bare_id = "/" not in resource_id
+    for element in elements:
+        if resource_id in element.resource_id:
+            if not bare_id or element.simple_id == resource_id:
+                return element
+            if first_match is None:
+                first_match = element
+    return first_match
 
 
 def find_element_by_index(
@@ -251,12 +444,145 @@ def find_element_by_index(
     index: int,
 ) -> Optional[UIElement]:
     """Find an element by its index."""
+    # parse_ui_elements and OCR number elements 0..N-1, so try direct access.
+    if 0 <= index < len(elements) and elements[index].index == index:
+        return elements[index]
+
     for element in elements:
         if element.index == index:
             return element
     return None
 
 
+# Distinct queries remembered per ElementIndex before the memo is reset.
+_MEMO_SIZE = 256
+
+
+class ElementIndex:
+    """
+    Trigram index over one UI dump for repeated substring lookups.
+
+    Built once per dump; find_by_text / find_by_resource_id return the same
+    element as find_element_by_text / find_element_by_resource_id but only
+    verify elements sharing every trigram of the query. Index and exact
+    lookups, and bare resource IDs, are answered from dicts. Substring
+    queries shorter than three characters fall back to a scan.
+
+    Results are memoized per index, so retrying the same query against an
+    unchanged dump is a dict lookup. A new dump gets a new index, which is
+    what invalidates the memo.
+    """
+
+    def __init__(self, elements: List[UIElement]):
+        self.elements = elements
+        self._text_grams = _build_trigrams((e.text_lc, e.desc_lc) for e in elements)
+        self._id_grams = _build_trigrams((e.resource_id,) for e in elements)
+        # Exact-match tables; setdefault keeps the first element, like a scan.
+        self._by_index: dict = {}
+        self._by_text: dict = {}
+        self._by_rid: dict = {}
+        self._by_simple: dict = {}
+        self._positions: dict = {}
+        for pos, element in enumerate(elements):
+            self._positions[id(element)] = pos
+            self._by_index.setdefault(element.index, element)
+            self._by_text.setdefault(element.text_lc, element)
+            self._by_text.setdefault(element.desc_lc, element)
+            self._by_rid.setdefault(element.resource_id, element)
+            if element.simple_id:
+                self._by_simple.setdefault(element.simple_id, element)
+        self._memo: dict = {}
+
+    def find_by_text(self, text: str, exact_match: bool = False) -> Optional[UIElement]:
+        """Indexed equivalent of find_element_by_text()."""
+        key = ("text", text, exact_match)
+        if key not in self._memo:
+            self._remember(key, self._find_by_text(text, exact_match))
+        return self._memo[key]
+
+    def find_by_any_text(
+        self, texts: List[str], exact_match: bool = False
+    ) -> Optional[UIElement]:
+        """Indexed equivalent of find_element_by_any_text()."""
+        # The first element matching any query is the earliest of the
+        # per-query first matches, each of which is indexed and memoized.
+        matches = [self.find_by_text(text, exact_match) for text in texts]
+        matches = [element for element in matches if element is not None]
+        if not matches:
+            return None
+        return min(matches, key=lambda element: self._positions[id(element)])
+
+    def find_by_resource_id(
+        self, resource_id: str, partial_match: bool = True
+    ) -> Optional[UIElement]:
+        """Indexed equivalent of find_element_by_resource_id()."""
+        key = ("resource_id", resource_id, partial_match)
+        if key not in self._memo:
+            self._remember(key, self._find_by_resource_id(resource_id, partial_match))
+        return self._memo[key]
+
+    def find_by_index(self, index: int) -> Optional[UIElement]:
+        """Equivalent of find_element_by_index()."""
+        return self._by_index.get(index)
+
+    def _remember(self, key: tuple, element: Optional[UIElement]) -> None:
+        if len(self._memo) >= _MEMO_SIZE:
+            self._memo.clear()
+        self._memo[key] = element
+
+    def _find_by_text(self, text: str, exact_match: bool) -> Optional[UIElement]:
+        text_lower = text.lower()
+        if exact_match:
+            return self._by_text.get(text_lower)
+        if len(text_lower) < 3:
+            return find_element_by_text(self.elements, text, exact_match)
+
+        for pos in _candidates(self._text_grams, text_lower):
+            element = self.elements[pos]
+            if text_lower in element.text_lc or text_lower in element.desc_lc:
+                return element
+        return None
+
+    def _find_by_resource_id(
+        self, resource_id: str, partial_match: bool
+    ) -> Optional[UIElement]:
+        if partial_match and "/" not in resource_id:
+            element = self._by_simple.get(resource_id)
+            if element is not None:
+                return element
+        if not partial_match:
+            return self._by_rid.get(resource_id)
+        if len(resource_id) < 3:
+            return find_element_by_resource_id(self.elements, resource_id, partial_match)
+
+        for pos in _candidates(self._id_grams, resource_id):
+            if resource_id in self.elements[pos].resource_id:
+                return self.elements[pos]
+        return None
+
+
+def _build_trigrams(fields_per_element) -> dict:
+    """Map each trigram to the set of element positions containing it."""
+    grams: dict = {}
+    for pos, fields in enumerate(fields_per_element):
+        for value in fields:
+            for i in range(len(value) - 2):
+                grams.setdefault(value[i:i + 3], set()).add(pos)
+    return grams
+
+
+def _candidates(grams: dict, query: str) -> List[int]:
+    """Positions that contain every trigram of query, in list order."""
+    sets = []
+    for i in range(len(query) - 2):
+        positions = grams.get(query[i:i + 3])
+        if not positions:
+            return []
+        sets.append(positions)
+    sets.sort(key=len)
+    return sorted(sets[0].intersection(*sets[1:]))
+
+
 def format_elements_for_llm(elements: List[UIElement], max_elements: int = 50) -> str:
     """Format UI elements as a string suitable for LLM consumption."""
     if not elements:
@@ -271,17 +597,11 @@ def format_elements_for_llm(elements: List[UIElement], max_elements: int = 50) -
             parts.append(f'text="{element.text}"')
         if element.content_desc:
             parts.append(f'desc="{element.content_desc}"')
-        if element.resource_id:
-            simple_id = (
-                element.resource_id.split("/")[-1]
-                if "/" in element.resource_id
-                else element.resource_id
-            )
-            parts.append(f'id="{simple_id}"')
+        if element.simple_id:
+            parts.append(f'id="{element.simple_id}"')
 
-        class_hint = element.class_name.split(".")[-1] if element.class_name else ""
-        if class_hint:
-            parts.append(f"({class_hint})")
+        if element.class_short:
+            parts.append(f"({element.class_short})")
 
         if element.clickable:
             parts.append("[clickable]")
@@ -298,6 +618,19 @@ def format_elements_for_llm(elements: List[UIElement], max_elements: int = 50) -
     return "\n".join(lines)
 
 
+# Only a few distinct IDs and class names occur per screen; memoizing their
+# short forms lets every element share one string instead of its own copy.
+@functools.lru_cache(maxsize=4096)
+def _tail(value: str, sep: str) -> str:
+    """The part of value after the last sep (all of value if sep is absent)."""
+    return value.rpartition(sep)[2]
+
+
+# Bounds repeat heavily: wrapper layouts share their child's bounds and
+# successive dumps of the same screen repeat almost every string. A cached
+# per-node parse also beats a batched np.fromregex pass: that only wins by
+# ~1 ms per 5000 never-seen bounds and loses on typical and repeated dumps.
+@functools.lru_cache(maxsize=4096)
 def _parse_bounds(bounds_str: str) -> Tuple[int, int, int, int]:
     """Parse bounds string from uiautomator."""
     try:
@@ -308,11 +641,3 @@ def _parse_bounds(bounds_str: str) -> Tuple[int, int, int, int]:
         pass
 
     return (0, 0, 0, 0)
-
-
-def _get_adb_prefix(device_id: str | None) -> list:
-    """Get ADB command prefix with optional device specifier."""
-    if device_id:
-        return ["adb", "-s", device_id]
-    return ["adb"]
-
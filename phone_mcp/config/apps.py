@@ -63,6 +63,14 @@ APP_PACKAGES: dict[str, str] = {
 }
 
 
+# Package name -> app name. Several names can share a package (e.g. 微信 and
+# WeChat); the first one listed wins.
+PACKAGE_TO_APP: dict[str, str] = {}
+for _name, _package in APP_PACKAGES.items():
+    PACKAGE_TO_APP.setdefault(_package, _name)
+del _name, _package
+
+
 def get_package_name(app_name: str) -> str | None:
     """Get the package name for an app."""
     return APP_PACKAGES.get(app_name)
@@ -70,10 +78,7 @@ def get_package_name(app_name: str) -> str | None:
 
 def get_app_name(package_name: str) -> str | None:
     """Get the app name from a package name."""
-    for name, package in APP_PACKAGES.items():
-        if package == package_name:
-            return name
-    return None
+    return PACKAGE_TO_APP.get(package_name)
 
 
 def list_supported_apps() -> list[str]:
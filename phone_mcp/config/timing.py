@@ -8,7 +8,13 @@ import os
 from dataclasses import dataclass
 
 
-@dataclass
+def _env_float(name: str, default: float) -> float:
+    """Read a float override from the environment."""
+    value = os.getenv(name)
+    return float(value) if value is not None else default
+
+
+@dataclass(slots=True)
 class DeviceTimingConfig:
     """Configuration for device operation timing delays."""
 
@@ -24,33 +30,23 @@ class DeviceTimingConfig:
 
     def __post_init__(self):
         """Load values from environment variables if present."""
-        self.default_tap_delay = float(
-            os.getenv("PHONE_MCP_TAP_DELAY", self.default_tap_delay)
-        )
-        self.default_double_tap_delay = float(
-            os.getenv("PHONE_MCP_DOUBLE_TAP_DELAY", self.default_double_tap_delay)
-        )
-        self.double_tap_interval = float(
-            os.getenv("PHONE_MCP_DOUBLE_TAP_INTERVAL", self.double_tap_interval)
-        )
-        self.default_long_press_delay = float(
-            os.getenv("PHONE_MCP_LONG_PRESS_DELAY", self.default_long_press_delay)
-        )
-        self.default_swipe_delay = float(
-            os.getenv("PHONE_MCP_SWIPE_DELAY", self.default_swipe_delay)
-        )
-        self.default_back_delay = float(
-            os.getenv("PHONE_MCP_BACK_DELAY", self.default_back_delay)
-        )
-        self.default_home_delay = float(
-            os.getenv("PHONE_MCP_HOME_DELAY", self.default_home_delay)
-        )
-        self.default_launch_delay = float(
-            os.getenv("PHONE_MCP_LAUNCH_DELAY", self.default_launch_delay)
-        )
+        for attr, env_var in _DEVICE_ENV_VARS:
+            setattr(self, attr, _env_float(env_var, getattr(self, attr)))
 
 
-@dataclass
+_DEVICE_ENV_VARS = (
+    ("default_tap_delay", "PHONE_MCP_TAP_DELAY"),
+    ("default_double_tap_delay", "PHONE_MCP_DOUBLE_TAP_DELAY"),
+    ("double_tap_interval", "PHONE_MCP_DOUBLE_TAP_INTERVAL"),
+    ("default_long_press_delay", "PHONE_MCP_LONG_PRESS_DELAY"),
+    ("default_swipe_delay", "PHONE_MCP_SWIPE_DELAY"),
+    ("default_back_delay", "PHONE_MCP_BACK_DELAY"),
+    ("default_home_delay", "PHONE_MCP_HOME_DELAY"),
+    ("default_launch_delay", "PHONE_MCP_LAUNCH_DELAY"),
+)
+
+
+@dataclass(slots=True)
 class ConnectionTimingConfig:
     """Configuration for ADB connection timing delays."""
 
@@ -59,11 +55,11 @@ class ConnectionTimingConfig:
 
     def __post_init__(self):
         """Load values from environment variables if present."""
-        self.adb_restart_delay = float(
-            os.getenv("PHONE_MCP_ADB_RESTART_DELAY", self.adb_restart_delay)
+        self.adb_restart_delay = _env_float(
+            "PHONE_MCP_ADB_RESTART_DELAY", self.adb_restart_delay
         )
-        self.server_restart_delay = float(
-            os.getenv("PHONE_MCP_SERVER_RESTART_DELAY", self.server_restart_delay)
+        self.server_restart_delay = _env_float(
+            "PHONE_MCP_SERVER_RESTART_DELAY", self.server_restart_delay
         )
 
 
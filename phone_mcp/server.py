@@ -12,10 +12,12 @@ Or import and run:
     server.run(host="0.0.0.0", port=8009)
 """
 
-import base64
+import asyncio
 import io
+import os
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 from PIL import Image as PILImage
 from fastmcp import FastMCP
@@ -24,27 +26,60 @@ from fastmcp.utilities.types import Image as MCPImage
 from phone_mcp.adb import (
     ADBConnection,
     list_devices as adb_list_devices,
-    get_screenshot as adb_get_screenshot,
-    tap as adb_tap,
-    double_tap as adb_double_tap,
-    long_press as adb_long_press,
-    swipe as adb_swipe,
-    back as adb_back,
-    home as adb_home,
-    launch_app as adb_launch_app,
-    get_current_app as adb_get_current_app,
+    get_screenshot_bytes_async as adb_get_screenshot_bytes_async,
+    get_screenshot_jpeg_async as adb_get_screenshot_jpeg_async,
+    tap_async as adb_tap_async,
+    double_tap_async as adb_double_tap_async,
+    long_press_async as adb_long_press_async,
+    swipe_async as adb_swipe_async,
+    back_async as adb_back_async,
+    home_async as adb_home_async,
+    press_key_async as adb_press_key_async,
+    tap_commands as adb_tap_commands,
+    double_tap_commands as adb_double_tap_commands,
+    long_press_commands as adb_long_press_commands,
+    swipe_commands as adb_swipe_commands,
+    back_commands as adb_back_commands,
+    home_commands as adb_home_commands,
+    press_key_commands as adb_press_key_commands,
+    sleep_commands as adb_sleep_commands,
+    run_input_script_async as adb_run_input_script_async,
+    launch_app_async as adb_launch_app_async,
+    launch_app_by_package_async as adb_launch_app_by_package_async,
+    get_current_app_async as adb_get_current_app_async,
+    search_installed_apps_async as adb_search_installed_apps_async,
     type_text as adb_type_text,
     clear_text as adb_clear_text,
     detect_and_set_adb_keyboard,
-    get_ui_elements as adb_get_ui_elements,
-    find_element_by_text as adb_find_element_by_text,
-    find_element_by_resource_id as adb_find_element_by_resource_id,
-    find_element_by_index as adb_find_element_by_index,
+    get_ui_elements_async as adb_get_ui_elements_async,
+    ElementIndex,
     format_elements_for_llm,
 )
+from phone_mcp.adb._jpeg import encode_jpeg
 
 # Global cache for UI elements
-_ui_elements_cache: dict = {"elements": [], "timestamp": 0, "mode": "xml"}
+_ui_elements_cache: dict = {"elements": [], "timestamp_ns": 0, "mode": "xml"}
+
+# Cached elements older than this (time.monotonic_ns() delta) are refetched.
+_UI_CACHE_TTL_NS = 30_000_000_000
+
+# Responses of tools whose success payload never varies, built once.
+# They are only serialized, never mutated.
+_CLEAR_TEXT_OK = {"status": "success", "action": "clear_text"}
+_BACK_OK = {"status": "success", "action": "back"}
+_HOME_OK = {"status": "success", "action": "home"}
+
+# Image decode/encode is CPU-bound; run it on its own pool so it neither
+# blocks the event loop nor queues behind blocking adb calls in to_thread.
+_cpu_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="phone-mcp-cpu"
+)
+
+
+async def _run_cpu(func, *args):
+    """Run a CPU-bound function on the dedicated image worker pool."""
+    return await asyncio.get_running_loop().run_in_executor(_cpu_executor, func, *args)
+
 
 # Create MCP Server instance
 mcp = FastMCP("PhoneMCP")
@@ -56,13 +91,13 @@ mcp = FastMCP("PhoneMCP")
 
 
 @mcp.tool()
-def list_devices() -> Dict[str, Any]:
+async def list_devices() -> Dict[str, Any]:
     """
     列出所有已连接的 Android 设备。
     List all connected Android devices.
     """
     try:
-        devices = adb_list_devices()
+        devices = await asyncio.to_thread(adb_list_devices)
         device_list = []
         for device in devices:
             device_list.append({
@@ -82,7 +117,7 @@ def list_devices() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def connect_device(address: str, timeout: int = 10) -> Dict[str, Any]:
+async def connect_device(address: str, timeout: int = 10) -> Dict[str, Any]:
     """
     连接到远程 Android 设备（通过 WiFi/TCP）。
     Connect to a remote Android device via WiFi/TCP.
@@ -93,7 +128,7 @@ def connect_device(address: str, timeout: int = 10) -> Dict[str, Any]:
     """
     try:
         conn = ADBConnection()
-        success, message = conn.connect(address, timeout)
+        success, message = await asyncio.to_thread(conn.connect, address, timeout)
 
         return {
             "status": "success" if success else "error",
@@ -105,7 +140,7 @@ def connect_device(address: str, timeout: int = 10) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def disconnect_device(address: Optional[str] = None) -> Dict[str, Any]:
+async def disconnect_device(address: Optional[str] = None) -> Dict[str, Any]:
     """
     断开与远程设备的连接。
     Disconnect from a remote device.
@@ -115,7 +150,7 @@ def disconnect_device(address: Optional[str] = None) -> Dict[str, Any]:
     """
     try:
         conn = ADBConnection()
-        success, message = conn.disconnect(address)
+        success, message = await asyncio.to_thread(conn.disconnect, address)
 
         return {
             "status": "success" if success else "error",
@@ -131,7 +166,7 @@ def disconnect_device(address: Optional[str] = None) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_screenshot(
+async def get_screenshot(
     device_id: Optional[str] = None,
     annotated: bool = False,
 ) -> MCPImage:
@@ -148,45 +183,89 @@ def get_screenshot(
             然后在截图上用红色方框和数字索引标注每个元素。
             标注后的截图可以配合 tap_element(index=N) 精准点击。
     """
-    screenshot = adb_get_screenshot(device_id)
+    if not annotated:
+        return await _capture_compact_screenshot(device_id)
 
-    image_bytes = base64.b64decode(screenshot.base64_data)
+    image_bytes = await adb_get_screenshot_bytes_async(device_id)
 
-    if annotated:
-        # Use cached elements if fresh, otherwise fetch new ones
-        global _ui_elements_cache
-        cache_age = time.time() - _ui_elements_cache.get("timestamp", 0)
-        elements = _ui_elements_cache.get("elements", [])
-        cached_mode = _ui_elements_cache.get("mode", "xml")
+    # Use cached elements if fresh, otherwise fetch new ones
+    global _ui_elements_cache
+    cache_age_ns = time.monotonic_ns() - _ui_elements_cache.get("timestamp_ns", 0)
+    elements = _ui_elements_cache.get("elements", [])
+    cached_mode = _ui_elements_cache.get("mode", "xml")
+
+    # A tap since the last dump may have changed the screen: re-dump so the
+    # boxes match the screenshot.
+    dirty = bool(_ui_elements_cache.get("dirty"))
+    if cache_age_ns > _UI_CACHE_TTL_NS or not elements or dirty:
+        if cached_mode == "ocr":
+            # OCR this very screenshot: the boxes line up with the image
+            # and the annotation below reuses the decoded pixels.
+            from phone_mcp.adb.ocr import ocr_get_ui_elements_async
+            elements = await ocr_get_ui_elements_async(
+                device_id, screenshot_bytes=image_bytes
+            )
+        else:
+            elements = await adb_get_ui_elements_async(
+                device_id, clickable_only=False, mode=cached_mode, fresh=dirty
+            )
+        _ui_elements_cache = {
+            "elements": elements,
+            "timestamp_ns": time.monotonic_ns(),
+            "mode": cached_mode,
+        }
 
-        if cache_age > 30 or not elements:
-            elements = adb_get_ui_elements(device_id, clickable_only=False, mode=cached_mode)
-            _ui_elements_cache = {
-                "elements": elements,
-                "timestamp": time.time(),
-                "mode": cached_mode,
-            }
+    from phone_mcp.adb.ocr import draw_annotated_screenshot
+    img_bytes = await _run_cpu(draw_annotated_screenshot, image_bytes, elements)
+    return MCPImage(data=img_bytes, format="jpeg")
+
+
+async def _capture_compact_screenshot(device_id: Optional[str]) -> MCPImage:
+    """Capture the screen as compactly as possible for returning to the client."""
+    # Raw framebuffer -> JPEG on the host: no PNG encode on the device and
+    # no PNG decode here.
+    jpeg_bytes = await adb_get_screenshot_jpeg_async(device_id, quality=60)
+    if jpeg_bytes is not None:
+        return MCPImage(data=jpeg_bytes, format="jpeg")
 
-        from phone_mcp.adb.ocr import draw_annotated_screenshot
-        img_bytes = draw_annotated_screenshot(image_bytes, elements)
-        return MCPImage(data=img_bytes, format="jpeg")
+    image_bytes = await adb_get_screenshot_bytes_async(device_id)
 
+    # Already JPEG, or a PNG small enough to send as-is: skip the
+    # decode + re-encode round-trip entirely.
+    if image_bytes[:2] == b'\xff\xd8':
+        return MCPImage(data=image_bytes, format="jpeg")
+    if len(image_bytes) <= _PNG_PASSTHROUGH_BYTES:
+        return MCPImage(data=image_bytes, format="png")
+
+    img_bytes = await _run_cpu(_compress_screenshot, image_bytes)
+    return MCPImage(data=img_bytes, format="jpeg")
+
+
+# PNG screenshots up to this size (mostly static, flat screens) are returned
+# without re-encoding; larger ones are converted to a compact JPEG.
+_PNG_PASSTHROUGH_BYTES = 400 * 1024
+
+
+def _compress_screenshot(image_bytes: bytes) -> bytes:
+    """Re-encode a PNG screenshot as a compact JPEG."""
     img = PILImage.open(io.BytesIO(image_bytes))
 
     # Convert RGBA to RGB (JPEG doesn't support transparency)
     if img.mode == 'RGBA':
-        rgb_img = PILImage.new('RGB', img.size, (255, 255, 255))
-        rgb_img.paste(img, mask=img.split()[3])
-        img = rgb_img
+        if img.getchannel('A').getextrema() == (255, 255):
+            # Screenshots are opaque: dropping alpha is much cheaper than a
+            # masked paste onto a white background.
+            img = img.convert('RGB')
+        else:
+            rgb_img = PILImage.new('RGB', img.size, (255, 255, 255))
+            rgb_img.paste(img, mask=img.split()[3])
+            img = rgb_img
     elif img.mode != 'RGB':
         img = img.convert('RGB')
 
-    # Compress image
-    output = io.BytesIO()
-    img.save(output, format='JPEG', quality=60, optimize=True)
-    img_bytes = output.getvalue()
-
-    return MCPImage(data=img_bytes, format="jpeg")
+    # Compress image: single-pass baseline 4:2:0 (libjpeg-turbo when available).
+    # optimize=True would add a second Huffman pass for a few percent of size.
+    return encode_jpeg(img, quality=60)
 
 
 # ============================================================================
@@ -195,33 +274,33 @@ def get_screenshot(
 
 
 @mcp.tool()
-def tap(x: int, y: int, device_id: Optional[str] = None, delay: float = 1.0) -> Dict[str, Any]:
+async def tap(x: int, y: int, device_id: Optional[str] = None, delay: float = 1.0) -> Dict[str, Any]:
     """
     在屏幕指定坐标点击。
     Tap at the specified coordinates on the screen.
     """
     try:
-        adb_tap(x, y, device_id, delay)
+        await adb_tap_async(x, y, device_id, delay)
         return {"status": "success", "action": "tap", "x": x, "y": y}
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
 
 @mcp.tool()
-def double_tap(x: int, y: int, device_id: Optional[str] = None, delay: float = 1.0) -> Dict[str, Any]:
+async def double_tap(x: int, y: int, device_id: Optional[str] = None, delay: float = 1.0) -> Dict[str, Any]:
     """
     在屏幕指定坐标双击。
     Double tap at the specified coordinates on the screen.
     """
     try:
-        adb_double_tap(x, y, device_id, delay)
+        await adb_double_tap_async(x, y, device_id, delay)
         return {"status": "success", "action": "double_tap", "x": x, "y": y}
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
 
 @mcp.tool()
-def long_press(
+async def long_press(
     x: int,
     y: int,
     duration_ms: int = 3000,
@@ -233,7 +312,7 @@ def long_press(
     Long press at the specified coordinates on the screen.
     """
     try:
-        adb_long_press(x, y, duration_ms, device_id, delay)
+        await adb_long_press_async(x, y, duration_ms, device_id, delay)
         return {
             "status": "success",
             "action": "long_press",
@@ -246,7 +325,7 @@ def long_press(
 
 
 @mcp.tool()
-def swipe(
+async def swipe(
     start_x: int,
     start_y: int,
     end_x: int,
@@ -260,7 +339,7 @@ def swipe(
     Swipe from start to end coordinates on the screen.
     """
     try:
-        adb_swipe(start_x, start_y, end_x, end_y, duration_ms, device_id, delay)
+        await adb_swipe_async(start_x, start_y, end_x, end_y, duration_ms, device_id, delay)
         return {
             "status": "success",
             "action": "swipe",
@@ -278,7 +357,7 @@ def swipe(
 
 
 @mcp.tool()
-def type_text(
+async def type_text(
     text: str,
     device_id: Optional[str] = None,
     clear_first: bool = True
@@ -295,10 +374,7 @@ def type_text(
     注意：需要设备已安装 ADB Keyboard。
     """
     try:
-        detect_and_set_adb_keyboard(device_id)
-        if clear_first:
-            adb_clear_text(device_id)
-        adb_type_text(text, device_id)
+        await asyncio.to_thread(_type_text, text, device_id, clear_first)
 
         return {"status": "success", "action": "type_text", "text": text, "cleared": clear_first}
     except Exception as e:
@@ -306,51 +382,59 @@ def type_text(
 
 
 @mcp.tool()
-def clear_text(device_id: Optional[str] = None) -> Dict[str, Any]:
+async def clear_text(device_id: Optional[str] = None) -> Dict[str, Any]:
     """
     清除当前聚焦输入框中的文本。
     Clear text in the currently focused input field.
     """
     try:
-        adb_clear_text(device_id)
-        return {"status": "success", "action": "clear_text"}
+        await asyncio.to_thread(adb_clear_text, device_id)
+        return _CLEAR_TEXT_OK
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
 
+def _type_text(text: str, device_id: Optional[str], clear_first: bool) -> None:
+    """Switch to ADB Keyboard, optionally clear the field, then type (blocking)."""
+    detect_and_set_adb_keyboard(device_id)
+    if clear_first:
+        adb_clear_text(device_id)
+    adb_type_text(text, device_id)
+
+
 # ============================================================================
 # System Button Tools
 # ============================================================================
 
 
 @mcp.tool()
-def press_back(device_id: Optional[str] = None, delay: float = 1.0) -> Dict[str, Any]:
+async def press_back(device_id: Optional[str] = None, delay: float = 1.0) -> Dict[str, Any]:
     """
     按下返回键。
     Press the back button.
     """
     try:
-        adb_back(device_id, delay)
-        return {"status": "success", "action": "back"}
+        await adb_back_async(device_id, delay)
+        return _BACK_OK
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
 
 @mcp.tool()
-def press_home(device_id: Optional[str] = None, delay: float = 1.0) -> Dict[str, Any]:
+async def press_home(device_id: Optional[str] = None, delay: float = 1.0) -> Dict[str, Any]:
     """
     按下主页键，返回桌面。
     Press the home button to return to the home screen.
     """
     try:
-        adb_home(device_id, delay)
-        return {"status": "success", "action": "home"}
+        await adb_home_async(device_id, delay)
+        return _HOME_OK
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
 
 @mcp.tool()
-def press_key(key: str, device_id: Optional[str] = None, delay: float = 0.5) -> Dict[str, Any]:
+async def press_key(key: str, device_id: Optional[str] = None, delay: float = 0.5) -> Dict[str, Any]:
     """
     发送按键事件。
     Send a key event to the device.
@@ -374,8 +458,7 @@ def press_key(key: str, device_id: Optional[str] = None, delay: float = 0.5) ->
         delay: 按键后的延迟（秒）
     """
     try:
-        from phone_mcp.adb.device import press_key as adb_press_key
-        adb_press_key(key, device_id, delay)
+        await adb_press_key_async(key, device_id, delay)
         return {"status": "success", "action": "press_key", "key": key}
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -387,7 +470,7 @@ def press_key(key: str, device_id: Optional[str] = None, delay: float = 0.5) ->
 
 
 @mcp.tool()
-def launch_app(
+async def launch_app(
     app_name: Optional[str] = None,
     package_name: Optional[str] = None,
     device_id: Optional[str] = None,
@@ -414,15 +497,14 @@ def launch_app(
 
         # 优先使用包名
         if package_name:
-            from phone_mcp.adb.device import launch_app_by_package
-            success = launch_app_by_package(package_name, device_id, delay)
+            success = await adb_launch_app_by_package_async(package_name, device_id, delay)
             if success:
                 return {"status": "success", "action": "launch_app", "package_name": package_name}
             else:
                 return {"status": "error", "error": f"Failed to launch app: {package_name}"}
 
         # 使用应用名称
-        success = adb_launch_app(app_name, device_id, delay)
+        success = await adb_launch_app_async(app_name, device_id, delay)
         if success:
             return {"status": "success", "action": "launch_app", "app_name": app_name}
         else:
@@ -435,20 +517,20 @@ def launch_app(
 
 
 @mcp.tool()
-def get_current_app(device_id: Optional[str] = None) -> Dict[str, Any]:
+async def get_current_app(device_id: Optional[str] = None) -> Dict[str, Any]:
     """
     获取当前前台应用名称。
     Get the name of the currently focused app.
     """
     try:
-        app_name = adb_get_current_app(device_id)
+        app_name = await adb_get_current_app_async(device_id)
         return {"status": "success", "app_name": app_name}
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
 
 @mcp.tool()
-def search_apps(keyword: str, device_id: Optional[str] = None) -> Dict[str, Any]:
+async def search_apps(keyword: str, device_id: Optional[str] = None) -> Dict[str, Any]:
     """
     搜索设备上已安装的应用。
     Search for installed apps on the device.
@@ -460,8 +542,7 @@ def search_apps(keyword: str, device_id: Optional[str] = None) -> Dict[str, Any]
         匹配的应用包名列表
     """
     try:
-        from phone_mcp.adb.device import search_installed_apps
-        apps = search_installed_apps(keyword, device_id)
+        apps = await adb_search_installed_apps_async(keyword, device_id)
         return {
             "status": "success",
             "apps": apps,
@@ -478,7 +559,7 @@ def search_apps(keyword: str, device_id: Optional[str] = None) -> Dict[str, Any]
 
 
 @mcp.tool()
-def get_ui_elements(
+async def get_ui_elements(
     device_id: Optional[str] = None,
     clickable_only: bool = False,
     mode: str = "xml",
@@ -507,26 +588,28 @@ def get_ui_elements(
     global _ui_elements_cache
 
     try:
-        elements = adb_get_ui_elements(device_id, clickable_only, mode=mode)
+        elements = await adb_get_ui_elements_async(device_id, clickable_only, mode=mode)
 
         _ui_elements_cache = {
             "elements": elements,
-            "timestamp": time.time(),
+            "timestamp_ns": time.monotonic_ns(),
             "mode": mode,
         }
 
-        element_list = []
-        for elem in elements:
-            element_list.append({
+        # Short IDs / class names are precomputed on each element at parse time.
+        element_list = [
+            {
                 "index": elem.index,
                 "text": elem.text,
                 "content_desc": elem.content_desc,
-                "resource_id": elem.resource_id.split("/")[-1] if "/" in elem.resource_id else elem.resource_id,
-                "class": elem.class_name.split(".")[-1] if elem.class_name else "",
+                "resource_id": elem.simple_id,
+                "class": elem.class_short,
                 "center": elem.center,
                 "bounds": elem.bounds,
                 "clickable": elem.clickable,
-            })
+            }
+            for elem in elements
+        ]
 
         formatted = format_elements_for_llm(elements)
 
@@ -543,13 +626,14 @@ def get_ui_elements(
 
 
 @mcp.tool()
-def tap_element(
+async def tap_element(
     index: Optional[int] = None,
     text: Optional[str] = None,
     resource_id: Optional[str] = None,
     device_id: Optional[str] = None,
     delay: float = 1.0,
     refresh: bool = False,
+    texts: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
     通过元素索引、文本或资源ID点击 UI 元素。
@@ -557,55 +641,75 @@ def tap_element(
 
     这是推荐的点击方式，比直接使用坐标更准确。
     优先使用 index（最快），其次是 text（模糊匹配），最后是 resource_id。
+    texts: 候选文本列表（如 ["确定", "OK", "允许"]），点击第一个包含其中任意一个文本的元素。
+    点击后界面可能已跳转，下一次 tap_element 会先重新获取元素再查找，
+    不会点击上一个界面的旧坐标。
     """
     global _ui_elements_cache
 
     try:
-        cache_age = time.time() - _ui_elements_cache.get("timestamp", 0)
+        cache_age_ns = time.monotonic_ns() - _ui_elements_cache.get("timestamp_ns", 0)
         elements = _ui_elements_cache.get("elements", [])
         cached_mode = _ui_elements_cache.get("mode", "xml")
 
-        if refresh or cache_age > 30 or not elements:
-            elements = adb_get_ui_elements(device_id, clickable_only=False, mode=cached_mode)
+        # A previous tap may have navigated away: any lookup on the kept dump
+        # (a dense index=N always resolves, and text may still match) could
+        # return coordinates from the old screen, so re-dump first.
+        # It must also not join a dump that started before that tap.
+        fresh = bool(refresh or _ui_elements_cache.get("dirty"))
+        refreshed = fresh or cache_age_ns > _UI_CACHE_TTL_NS or not elements
+        if refreshed:
+            elements = await adb_get_ui_elements_async(
+                device_id, clickable_only=False, mode=cached_mode, fresh=fresh
+            )
             _ui_elements_cache = {
                 "elements": elements,
-                "timestamp": time.time(),
+                "timestamp_ns": time.monotonic_ns(),
                 "mode": cached_mode,
             }
 
         element = None
         search_method = ""
+        element_index = _get_element_index(elements)
 
         if index is not None:
-            element = adb_find_element_by_index(elements, index)
+            element = element_index.find_by_index(index)
             search_method = f"index={index}"
         elif text is not None:
-            element = adb_find_element_by_text(elements, text, exact_match=False)
+            element = element_index.find_by_text(text, exact_match=False)
             search_method = f"text='{text}'"
+        elif texts:
+            element = element_index.find_by_any_text(texts, exact_match=False)
+            search_method = f"texts={texts!r}"
         elif resource_id is not None:
-            element = adb_find_element_by_resource_id(elements, resource_id, partial_match=True)
+            element = element_index.find_by_resource_id(resource_id, partial_match=True)
             search_method = f"resource_id='{resource_id}'"
         else:
             return {
                 "status": "error",
-                "error": "Must provide at least one of: index, text, or resource_id"
+                "error": "Must provide at least one of: index, text, texts, or resource_id"
             }
 
         if element is None:
-            if not refresh:
-                elements = adb_get_ui_elements(device_id, clickable_only=False, mode=cached_mode)
+            if not refreshed:
+                elements = await adb_get_ui_elements_async(
+                    device_id, clickable_only=False, mode=cached_mode
+                )
                 _ui_elements_cache = {
                     "elements": elements,
-                    "timestamp": time.time(),
+                    "timestamp_ns": time.monotonic_ns(),
                     "mode": cached_mode,
                 }
 
+                element_index = _get_element_index(elements)
                 if index is not None:
-                    element = adb_find_element_by_index(elements, index)
+                    element = element_index.find_by_index(index)
                 elif text is not None:
-                    element = adb_find_element_by_text(elements, text, exact_match=False)
+                    element = element_index.find_by_text(text, exact_match=False)
+                elif texts:
+                    element = element_index.find_by_any_text(texts, exact_match=False)
                 elif resource_id is not None:
-                    element = adb_find_element_by_resource_id(elements, resource_id, partial_match=True)
+                    element = element_index.find_by_resource_id(resource_id, partial_match=True)
 
             if element is None:
                 return {
@@ -615,9 +719,11 @@ def tap_element(
                 }
 
         x, y = element.center
-        adb_tap(x, y, device_id, delay)
+        await adb_tap_async(x, y, device_id, delay)
 
-        _ui_elements_cache = {"elements": [], "timestamp": 0, "mode": "xml"}
+        # The tap may have changed the screen: the next tap_element and
+        # annotated screenshot re-dump before using these elements.
+        _ui_elements_cache["dirty"] = True
 
         return {
             "status": "success",
@@ -635,19 +741,234 @@ def tap_element(
         return {"status": "error", "error": str(e)}
 
 
+def _get_element_index(elements: list) -> ElementIndex:
+    """Get the lookup index for the cached elements, building it once per refresh."""
+    element_index = _ui_elements_cache.get("index")
+    if element_index is None or element_index.elements is not elements:
+        element_index = ElementIndex(elements)
+        if _ui_elements_cache.get("elements") is elements:
+            _ui_elements_cache["index"] = element_index
+    return element_index
+
+
+# ============================================================================
+# Batch Tools
+# ============================================================================
+
+
+@mcp.tool()
+async def batch_actions(
+    actions: List[Dict[str, Any]],
+    device_id: Optional[str] = None,
+    validate_after: bool = False,
+    stop_on_error: bool = True,
+) -> Any:
+    """
+    按顺序执行一组操作，中间不截图、不返回给模型。
+    Run a sequence of actions in one call.
+
+    适合步骤已经确定的场景（如：启动应用 → 点击坐标 → 输入文本），
+    省去每一步的模型往返。
+
+    Args:
+        actions: 操作列表，每项是一个 dict，"type" 取值：
+            - {"type": "tap", "x": 100, "y": 200}
+            - {"type": "double_tap", "x": 100, "y": 200}
+            - {"type": "long_press", "x": 100, "y": 200, "duration_ms": 3000}
+            - {"type": "swipe", "start_x": 0, "start_y": 800, "end_x": 0, "end_y": 200, "duration_ms": 500}
+            - {"type": "key", "key": "enter"}
+            - {"type": "back"} / {"type": "home"}
+            - {"type": "text", "text": "hello", "clear_first": true}
+            - {"type": "launch", "app_name": "微信"} 或 {"type": "launch", "package_name": "com.tencent.mm"}
+            - {"type": "sleep", "seconds": 1.0}
+            除 sleep 外都可带 "delay"（秒），覆盖该操作后的默认等待时间。
+        device_id: 设备 ID
+        validate_after: 全部执行完后附带一张截图
+        stop_on_error: 某一步失败时是否停止后续操作（默认 True）
+
+    连续的纯输入操作（tap/double_tap/long_press/swipe/key/back/home/sleep）
+    会合并成一个设备端 shell 脚本，一次 adb 往返执行完，等待也在设备上进行。
+    """
+    results = []
+    status = "success"
+    # A run of consecutive input actions, sent as one device-side script.
+    run_indices: List[int] = []
+    run_commands: List[str] = []
+
+    def record_error(i: int, error: Exception) -> None:
+        nonlocal status
+        status = "error"
+        results.append({
+            "index": i,
+            "type": actions[i].get("type"),
+            "status": "error",
+            "error": str(error),
+        })
+
+    async def flush_run() -> bool:
+        """Execute the pending input run; False if batch_actions should stop."""
+        indices = run_indices[:]
+        commands = run_commands[:]
+        run_indices.clear()
+        run_commands.clear()
+        if not indices:
+            return True
+        try:
+            await adb_run_input_script_async(commands, device_id)
+        except Exception as e:
+            # The script ran as a unit, so which step failed (and which ran)
+            # is unknown: report the whole run as failed.
+            for i in indices:
+                record_error(i, e)
+            return not stop_on_error
+        for i in indices:
+            results.append({"index": i, "type": actions[i].get("type"), "status": "success"})
+        return True
+
+    for i, action in enumerate(actions):
+        try:
+            commands = _input_commands(action)
+        except Exception:
+            # Invalid parameters: let _run_batch_action report the error.
+            commands = None
+
+        if commands is not None:
+            run_indices.append(i)
+            run_commands.extend(commands)
+            continue
+
+        if not await flush_run():
+            break
+        try:
+            await _run_batch_action(action, device_id)
+            results.append({"index": i, "type": action.get("type"), "status": "success"})
+        except Exception as e:
+            record_error(i, e)
+            if stop_on_error:
+                break
+    else:
+        await flush_run()
+
+    response = {
+        "status": status,
+        "action": "batch_actions",
+        "results": results,
+        "executed": len(results),
+        "total": len(actions),
+    }
+
+    if not validate_after:
+        return response
+
+    return [response, await _capture_compact_screenshot(device_id)]
+
+
+def _input_commands(action: Dict[str, Any]) -> Optional[List[str]]:
+    """Device shell commands for a plain input action, or None if it needs the host."""
+    kind = action.get("type")
+    delay = action.get("delay")
+
+    if kind == "tap":
+        return adb_tap_commands(int(action["x"]), int(action["y"]), delay)
+    if kind == "double_tap":
+        return adb_double_tap_commands(int(action["x"]), int(action["y"]), delay)
+    if kind == "long_press":
+        return adb_long_press_commands(
+            int(action["x"]), int(action["y"]), int(action.get("duration_ms", 3000)), delay
+        )
+    if kind == "swipe":
+        duration_ms = action.get("duration_ms")
+        return adb_swipe_commands(
+            int(action["start_x"]),
+            int(action["start_y"]),
+            int(action["end_x"]),
+            int(action["end_y"]),
+            int(duration_ms) if duration_ms is not None else None,
+            delay,
+        )
+    if kind == "key":
+        return adb_press_key_commands(str(action["key"]), 0.5 if delay is None else delay)
+    if kind == "back":
+        return adb_back_commands(delay)
+    if kind == "home":
+        return adb_home_commands(delay)
+    if kind == "sleep":
+        return adb_sleep_commands(float(action.get("seconds", 1.0)))
+    return None
+
+
+async def _run_batch_action(action: Dict[str, Any], device_id: Optional[str]) -> None:
+    """Execute one batch_actions step; raises on invalid or failed actions."""
+    kind = action.get("type")
+    delay = action.get("delay")
+
+    if kind == "tap":
+        await adb_tap_async(int(action["x"]), int(action["y"]), device_id, delay)
+    elif kind == "double_tap":
+        await adb_double_tap_async(int(action["x"]), int(action["y"]), device_id, delay)
+    elif kind == "long_press":
+        await adb_long_press_async(
+            int(action["x"]),
+            int(action["y"]),
+            int(action.get("duration_ms", 3000)),
+            device_id,
+            delay,
+        )
+    elif kind == "swipe":
+        duration_ms = action.get("duration_ms")
+        await adb_swipe_async(
+            int(action["start_x"]),
+            int(action["start_y"]),
+            int(action["end_x"]),
+            int(action["end_y"]),
+            int(duration_ms) if duration_ms is not None else None,
+            device_id,
+            delay,
+        )
+    elif kind == "key":
+        await adb_press_key_async(str(action["key"]), device_id, 0.5 if delay is None else delay)
+    elif kind == "back":
+        await adb_back_async(device_id, delay)
+    elif kind == "home":
+        await adb_home_async(device_id, delay)
+    elif kind == "text":
+        await asyncio.to_thread(
+            _type_text, str(action["text"]), device_id, action.get("clear_first", True)
+        )
+        if delay:
+            await asyncio.sleep(delay)
+    elif kind == "launch":
+        if action.get("package_name"):
+            success = await adb_launch_app_by_package_async(
+                action["package_name"], device_id, delay
+            )
+        elif action.get("app_name"):
+            success = await adb_launch_app_async(action["app_name"], device_id, delay)
+        else:
+            raise ValueError("launch requires app_name or package_name")
+        if not success:
+            raise RuntimeError(
+                f"Failed to launch app: {action.get('package_name') or action.get('app_name')}"
+            )
+    elif kind == "sleep":
+        await asyncio.sleep(float(action.get("seconds", 1.0)))
+    else:
+        raise ValueError(f"Unknown action type: {kind!r}")
+
+
 # ============================================================================
 # Utility Tools
 # ============================================================================
 
 
 @mcp.tool()
-def wait(seconds: float = 1.0) -> Dict[str, Any]:
+async def wait(seconds: float = 1.0) -> Dict[str, Any]:
     """
     等待指定时间。
     Wait for a specified duration.
     """
     try:
-        time.sleep(seconds)
+        await asyncio.sleep(seconds)
         return {"status": "success", "action": "wait", "seconds": seconds}
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -686,8 +1007,14 @@ def run(transport: str = "sse", host: str = "0.0.0.0", port: int = 8009, path: s
     print("  - launch_app            启动应用")
     print("  - get_current_app       获取当前应用")
     print("  - search_apps           搜索已安装应用")
+    print("  - batch_actions         批量执行操作")
     print("  - wait                  等待")
     print("=" * 60)
+    # 可选：后台预加载 OCR 模型，避免首次 OCR 请求卡顿数秒
+    if os.getenv("PHONE_MCP_OCR_WARMUP") == "1":
+        from phone_mcp.adb.ocr import warmup_ocr
+        warmup_ocr()
+
     print("\n🎯 Starting server...\n")
 
     mcp.run(transport=transport, host=host, port=port, path=path)
@@ -0,0 +1,124 @@
+"""_build_launch_script run by a local sh against stubbed am / cmd / monkey."""
+
+import os
+import stat
+import subprocess
+
+import pytest
+
+from phone_mcp.adb.device import _ACTIVITY_MARKER, _build_launch_script
+
+PACKAGE = "com.example.app"
+
+# Each stub logs its argv. am prints an error for activities listed in
+# $AM_FAIL (am itself exits 0 in that case); cmd prints $RESOLVED, if set,
+# after a priority line like resolve-activity --brief does.
+STUBS = {
+    "am": """
+echo "am $*" >>"$LOG"
+for a in $AM_FAIL; do
+  case " $* " in *" $a "*) echo "Error: Activity class {$a} does not exist."; exit 0;; esac
+done
+echo "Starting: Intent { cmp=$3 }"
+""",
+    "cmd": """
+echo "cmd $*" >>"$LOG"
+echo "priority=0 preferredOrder=0 match=0x108000 specificIndex=-1 isDefault=true"
+[ -n "$RESOLVED" ] && echo "$RESOLVED"
+exit 0
+""",
+    "monkey": """
+echo "monkey $*" >>"$LOG"
+echo "Events injected: 1"
+""",
+}
+
+
+@pytest.fixture
+def run_script(tmp_path):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for name, body in STUBS.items():
+        path = bin_dir / name
+        path.write_text("#!/bin/sh\n" + body)
+        path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    log = tmp_path / "calls.log"
+
+    def run(script, resolved="", am_fail=""):
+        env = dict(
+            os.environ,
+            PATH=f"{bin_dir}{os.pathsep}{os.environ['PATH']}",
+            LOG=str(log),
+            RESOLVED=resolved,
+            AM_FAIL=am_fail,
+        )
+        result = subprocess.run(
+            ["sh", "-c", script],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        calls = log.read_text().splitlines() if log.exists() else []
+        log.unlink(missing_ok=True)
+        return result.stdout, calls
+
+    return run
+
+
+def test_cached_activity_skips_resolution(run_script):
+    script = _build_launch_script(PACKAGE, False, f"{PACKAGE}/.Main")
+    output, calls = run_script(script)
+    assert calls == [f"am start -n {PACKAGE}/.Main"]
+    assert _ACTIVITY_MARKER not in output
+
+
+def test_resolves_and_reports_launcher_activity(run_script):
+    output, calls = run_script(
+        _build_launch_script(PACKAGE, True), resolved=f"{PACKAGE}/.Launcher"
+    )
+    assert calls[0].startswith("cmd package resolve-activity --brief")
+    assert calls[1:] == [f"am start -n {PACKAGE}/.Launcher"]
+    assert f"{_ACTIVITY_MARKER}{PACKAGE}/.Launcher\n" in output
+
+
+def test_stale_cached_activity_falls_back_to_resolution(run_script):
+    script = _build_launch_script(PACKAGE, False, f"{PACKAGE}/.Gone")
+    output, calls = run_script(
+        script, resolved=f"{PACKAGE}/.Launcher", am_fail=f"{PACKAGE}/.Gone"
+    )
+    assert calls[0] == f"am start -n {PACKAGE}/.Gone"
+    assert calls[2] == f"am start -n {PACKAGE}/.Launcher"
+    assert len(calls) == 3
+    assert f"{_ACTIVITY_MARKER}{PACKAGE}/.Launcher\n" in output
+
+
+def test_unresolved_package_tries_main_activity(run_script):
+    output, calls = run_script(_build_launch_script(PACKAGE, True))
+    assert len(calls) == 2
+    assert calls[1].startswith("am start -a android.intent.action.MAIN")
+    assert calls[1].endswith(f"-n {PACKAGE}/.MainActivity")
+    assert f"{_ACTIVITY_MARKER}\n" in output
+
+
+def test_failed_starts_fall_back_to_monkey(run_script):
+    output, calls = run_script(
+        _build_launch_script(PACKAGE, True),
+        resolved=f"{PACKAGE}/.Launcher",
+        am_fail=f"{PACKAGE}/.Launcher {PACKAGE}/.MainActivity",
+    )
+    assert [call.split()[0] for call in calls] == ["cmd", "am", "am", "monkey"]
+    assert calls[-1] == f"monkey -p {PACKAGE} -c android.intent.category.LAUNCHER 1"
+    assert "Events injected: 1" in output
+
+
+def test_without_main_activity_goes_straight_to_monkey(run_script):
+    _, calls = run_script(_build_launch_script(PACKAGE, False))
+    assert [call.split()[0] for call in calls] == ["cmd", "monkey"]
+
+
+def test_package_name_is_quoted(run_script, tmp_path):
+    _, calls = run_script(_build_launch_script("com.example;touch pwned", False))
+    assert calls[-1] == "monkey -p com.example;touch pwned -c android.intent.category.LAUNCHER 1"
+    assert not (tmp_path / "pwned").exists()
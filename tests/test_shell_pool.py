@@ -0,0 +1,77 @@
+"""PersistentAdbShell sentinel protocol, driven by a local sh standing in for adb."""
+
+import stat
+import subprocess
+
+import pytest
+
+from phone_mcp.adb._shell_pool import PersistentAdbShell
+
+
+def _fake_adb(tmp_path, body):
+    path = tmp_path / "adb"
+    path.write_text("#!/bin/sh\n" + body)
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+@pytest.fixture
+def shell(tmp_path):
+    # "adb [-s serial] shell" -> a plain sh reading commands from stdin.
+    shell = PersistentAdbShell(adb_path=_fake_adb(tmp_path, "exec sh\n"))
+    yield shell
+    shell.close()
+
+
+def test_output_and_exit_code(shell):
+    assert shell.run("echo hello") == (0, "hello\n")
+
+
+def test_output_without_trailing_newline(shell):
+    assert shell.run("printf abc") == (0, "abc")
+    # The next command starts cleanly after the sentinel.
+    assert shell.run("printf 'x\\ny'") == (0, "x\ny")
+
+
+def test_non_zero_exit(shell):
+    assert shell.run("false") == (1, "")
+    assert shell.run("echo partial; sh -c 'exit 3'") == (3, "partial\n")
+    # A failing command does not take the shell down with it.
+    assert shell.run("echo still alive") == (0, "still alive\n")
+
+
+def test_command_cannot_read_following_commands(shell):
+    assert shell.run("cat") == (0, "")
+    assert shell.run("echo next") == (0, "next\n")
+
+
+def test_run_bytes_returns_raw_output(shell):
+    assert shell.run_bytes("printf '\\001\\377'") == (0, b"\x01\xff")
+
+
+def test_timeout_kills_and_respawns(shell):
+    with pytest.raises(subprocess.TimeoutExpired):
+        shell.run("sleep 5", timeout=0.2)
+    assert shell.run("echo back") == (0, "back\n")
+
+
+def test_dead_shell_reports_stderr_and_exit_code(tmp_path):
+    adb = _fake_adb(tmp_path, "echo 'error: device unauthorized.' >&2\nexit 1\n")
+    shell = PersistentAdbShell(device_id="emulator-5554", adb_path=adb)
+    try:
+        returncode, output = shell.run("echo hi")
+        assert returncode == 1
+        assert "device unauthorized" in output
+        assert shell._proc is None
+    finally:
+        shell.close()
+
+
+def test_device_id_is_passed_to_adb(tmp_path):
+    adb = _fake_adb(tmp_path, 'echo "$@" >"$(dirname "$0")/args"\nexec sh\n')
+    shell = PersistentAdbShell(device_id="emulator-5554", adb_path=adb)
+    try:
+        assert shell.run("true") == (0, "")
+    finally:
+        shell.close()
+    assert (tmp_path / "args").read_text() == "-s emulator-5554 shell\n"
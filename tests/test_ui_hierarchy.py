@@ -0,0 +1,146 @@
+"""Lookups on a parsed uiautomator dump: indexed vs. linear-scan results."""
+
+import pytest
+
+from phone_mcp.adb.ui_hierarchy import (
+    ElementIndex,
+    find_element_by_any_text,
+    find_element_by_index,
+    find_element_by_resource_id,
+    find_element_by_text,
+    parse_ui_elements,
+)
+
+DUMP = """<?xml version='1.0' encoding='UTF-8' standalone='yes' ?>
+<hierarchy rotation="0">
+  <node index="0" text="" resource-id="" class="android.widget.FrameLayout" content-desc="" clickable="false" enabled="true" focused="false" selected="false" bounds="[0,0][1080,2400]">
+    <node index="0" text="Chats" resource-id="com.example:id/title" class="android.widget.TextView" content-desc="" clickable="false" enabled="true" focused="false" selected="false" bounds="[0,100][1080,200]" />
+    <node index="1" text="" resource-id="com.example:id/send_btn_icon" class="android.widget.ImageView" content-desc="Send icon" clickable="false" enabled="true" focused="false" selected="false" bounds="[900,2200][960,2260]" />
+    <node index="2" text="Send" resource-id="com.example:id/send_btn" class="android.widget.Button" content-desc="" clickable="true" enabled="true" focused="false" selected="false" bounds="[880,2180][1060,2280]" />
+    <node index="3" text="确定" resource-id="android:id/button1" class="android.widget.Button" content-desc="" clickable="true" enabled="true" focused="false" selected="false" bounds="[600,1400][1000,1500]" />
+    <node index="4" text="" resource-id="" class="android.widget.ImageButton" content-desc="More options" clickable="true" enabled="true" focused="false" selected="false" bounds="[980,100][1080,200]" />
+    <node index="5" text="Settings and privacy" resource-id="com.example:id/menu_item" class="android.widget.TextView" content-desc="" clickable="true" enabled="true" focused="false" selected="false" bounds="[0,300][1080,400]" />
+    <node index="6" text="OK" resource-id="com.example:id/ok" class="android.widget.Button" content-desc="" clickable="true" enabled="true" focused="false" selected="false" bounds="[0,0][0,0]" />
+  </node>
+</hierarchy>
+"""
+
+
+def _scan_text(elements, text, exact_match):
+    """The original linear lookup: first element whose text or desc matches."""
+    query = text.lower()
+    for element in elements:
+        values = (element.text.lower(), element.content_desc.lower())
+        if (query in values) if exact_match else any(query in v for v in values):
+            return element
+    return None
+
+
+def _scan_resource_id(elements, resource_id, partial_match):
+    """The original linear lookup: first substring (or exact) match."""
+    for element in elements:
+        if partial_match and resource_id in element.resource_id:
+            return element
+        if not partial_match and element.resource_id == resource_id:
+            return element
+    return None
+
+
+@pytest.fixture
+def elements():
+    return parse_ui_elements(DUMP, clickable_only=False)
+
+
+def test_parse_skips_empty_bounds_and_containers(elements):
+    assert [e.index for e in elements] == list(range(6))
+    assert [e.text for e in elements][:3] == ["Chats", "", "Send"]
+    assert elements[2].center == (970, 2230)
+    assert elements[2].simple_id == "send_btn"
+
+
+def test_parse_accepts_bytes(elements):
+    assert parse_ui_elements(DUMP.encode("utf-8"), clickable_only=False) == elements
+
+
+@pytest.mark.parametrize("exact_match", [False, True])
+@pytest.mark.parametrize(
+    "text",
+    ["Chats", "chats", "Send", "send", "se", "确定", "More", "options", "privacy",
+     "Settings and privacy", "icon", "missing", "OK"],
+)
+def test_text_lookups_match_linear_scan(elements, text, exact_match):
+    expected = _scan_text(elements, text, exact_match)
+    assert find_element_by_text(elements, text, exact_match) is expected
+    assert ElementIndex(elements).find_by_text(text, exact_match) is expected
+
+
+@pytest.mark.parametrize("exact_match", [False, True])
+@pytest.mark.parametrize(
+    "texts",
+    [["确定", "OK", "允许"], ["privacy", "send"], ["more options", "chats"],
+     ["nope", "nothing"], ["se", "ch"]],
+)
+def test_any_text_lookups_return_first_element_in_dump_order(elements, texts, exact_match):
+    matches = [_scan_text(elements, text, exact_match) for text in texts]
+    matches = [e for e in matches if e is not None]
+    expected = min(matches, key=elements.index) if matches else None
+    assert find_element_by_any_text(elements, texts, exact_match) is expected
+    assert ElementIndex(elements).find_by_any_text(texts, exact_match) is expected
+
+
+@pytest.mark.parametrize(
+    "resource_id",
+    ["com.example:id/title", "id/send", "example:id/menu", "android:id/button1", "id/", "zz"],
+)
+@pytest.mark.parametrize("partial_match", [False, True])
+def test_qualified_resource_id_lookups_match_linear_scan(elements, resource_id, partial_match):
+    expected = _scan_resource_id(elements, resource_id, partial_match)
+    assert find_element_by_resource_id(elements, resource_id, partial_match) is expected
+    assert ElementIndex(elements).find_by_resource_id(resource_id, partial_match) is expected
+
+
+def test_bare_resource_id_prefers_exact_simple_id(elements):
+    # The linear scan would hit send_btn_icon first; the bare ID names send_btn.
+    assert _scan_resource_id(elements, "send_btn", True).simple_id == "send_btn_icon"
+    for found in (
+        find_element_by_resource_id(elements, "send_btn"),
+        ElementIndex(elements).find_by_resource_id("send_btn"),
+    ):
+        assert found.simple_id == "send_btn"
+
+
+def test_bare_resource_id_falls_back_to_first_partial_match(elements):
+    for found in (
+        find_element_by_resource_id(elements, "send"),
+        ElementIndex(elements).find_by_resource_id("send"),
+        find_element_by_resource_id(elements, "btn_ic"),
+        ElementIndex(elements).find_by_resource_id("btn_ic"),
+    ):
+        assert found.simple_id == "send_btn_icon"
+
+
+def test_index_lookups(elements):
+    index = ElementIndex(elements)
+    for i in (-1, 0, 3, 5, 6):
+        assert index.find_by_index(i) is find_element_by_index(elements, i)
+    assert index.find_by_index(3).text == "确定"
+    assert index.find_by_index(6) is None
+
+
+def test_memoized_lookup_is_stable(elements):
+    index = ElementIndex(elements)
+    first = index.find_by_text("privacy")
+    assert index.find_by_text("privacy") is first
+    assert index.find_by_text("missing") is None
+    assert index.find_by_text("missing") is None
+
+
+def test_any_text_with_ahocorasick_matches_plain_scan(elements, monkeypatch):
+    import phone_mcp.adb.ui_hierarchy as ui_hierarchy
+
+    if ui_hierarchy._get_ahocorasick() is None:
+        pytest.skip("pyahocorasick not installed")
+    texts = ["privacy", "send", "确定"]
+    with_automaton = find_element_by_any_text(elements, texts)
+    monkeypatch.setattr(ui_hierarchy, "_ahocorasick", False)
+    assert find_element_by_any_text(elements, texts) is with_automaton